@@ -1,6 +1,40 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME, ActionForm
+from django.contrib.auth import get_user_model
+from django.template.response import TemplateResponse
 
 from .models import Category, Comment, Location, Post
+from .moderation import (
+    move_posts,
+    publish_posts,
+    purge_authors,
+    unpublish_posts,
+)
+from core.filters import RelatedIdFilter, UsernameFilter
+from core.jobs import enqueue
+from core.paginators import EstimatedCountPaginator
+
+UserModel = get_user_model()
+
+
+class PostIdFilter(RelatedIdFilter):
+    title = 'публикация (id)'
+    parameter_name = 'post'
+    field_name = 'post'
+
+
+class PostActionForm(ActionForm):
+    category = forms.ModelChoiceField(
+        queryset=Category.objects.all(),
+        required=False,
+        label='Категория',
+    )
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Category)
@@ -16,16 +50,90 @@ class LocationAdmin(admin.ModelAdmin):
 
 
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(LargeTableAdmin):
     list_display = ('title', 'pub_date', 'author', 'is_published')
-    search_fields = ('title', 'author')
-    list_filter = ('category',)
+    list_select_related = ('author',)
+    search_fields = ('title', '=author__username')
+    list_filter = ('is_published', 'category', UsernameFilter)
     list_display_links = ('title',)
+    autocomplete_fields = ('author', 'category', 'location')
+    action_form = PostActionForm
+    actions = (
+        'publish_selected',
+        'unpublish_selected',
+        'move_selected',
+        'purge_selected_authors',
+    )
+
+    @admin.action(description='Опубликовать выбранные публикации')
+    def publish_selected(self, request, queryset):
+        updated = publish_posts(queryset)
+        self.message_user(request, f'Опубликовано публикаций: {updated}')
+
+    @admin.action(description='Снять с публикации выбранные публикации')
+    def unpublish_selected(self, request, queryset):
+        updated = unpublish_posts(queryset)
+        self.message_user(
+            request, f'Снято с публикации публикаций: {updated}'
+        )
+
+    @admin.action(description='Перенести выбранные публикации в категорию')
+    def move_selected(self, request, queryset):
+        form = self.action_form(request.POST)
+        form.fields['action'].choices = self.get_action_choices(request)
+        category = form.cleaned_data['category'] if form.is_valid() else None
+        if category is None:
+            self.message_user(
+                request, 'Выберите категорию для переноса.', messages.ERROR
+            )
+            return
+        updated = move_posts(queryset, category)
+        self.message_user(
+            request, f'Перенесено в «{category}» публикаций: {updated}'
+        )
+
+    @admin.action(
+        description='Удалить все публикации и комментарии авторов выбранных'
+        ' публикаций'
+    )
+    def purge_selected_authors(self, request, queryset):
+        author_ids = list(
+            queryset.order_by().values_list('author', flat=True).distinct()
+        )
+        if request.POST.get('post'):
+            enqueue(purge_authors, author_ids)
+            self.message_user(
+                request,
+                'Удаление содержимого авторов поставлено в очередь:'
+                f' {len(author_ids)}',
+            )
+            return None
+        context = {
+            **self.admin_site.each_context(request),
+            'title': 'Вы уверены?',
+            'opts': self.model._meta,
+            'queryset': queryset,
+            'authors': UserModel.objects.filter(
+                pk__in=author_ids
+            ).order_by('username'),
+            'post_count': Post.objects.filter(author__in=author_ids).count(),
+            'comment_count': Comment.objects.filter(
+                author__in=author_ids
+            ).count(),
+            'action_checkbox_name': ACTION_CHECKBOX_NAME,
+        }
+        request.current_app = self.admin_site.name
+        return TemplateResponse(
+            request, 'admin/blog/post/purge_authors_confirmation.html', context
+        )
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(LargeTableAdmin):
     list_display = ('text', 'created_at', 'post', 'author')
-    search_fields = ('text', 'author')
-    list_filter = ('post',)
+    list_select_related = ('post', 'author')
+    search_fields = ('text', '=author__username')
+    list_filter = (PostIdFilter, UsernameFilter)
     list_display_links = ('text',)
+    raw_id_fields = ('post',)
+    autocomplete_fields = ('author',)
@@ -0,0 +1,164 @@
+import random
+import secrets
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection, connections
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from .caching import get_cache
+from .mixins import PostFeedMixin, VisiblePostMixin
+from .models import Comment, Post
+from .moderation import delete_comments
+from core.benchmark import measure, percentile
+from core.sqlite import DEFAULT_PRAGMAS, read_pragmas
+from core.utils import select_posts
+
+
+def get_targets():
+    post = (
+        Post.objects.filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now(),
+        )
+        .select_related('author', 'category')
+        .order_by('-comment_count')
+        .first()
+    )
+    if post is None:
+        raise ValueError('Нет опубликованных постов для замеров.')
+    anonymous = Client()
+    author = Client()
+    author.force_login(post.author)
+    username = post.author.username
+    return [
+        ('blog:index', anonymous, reverse('blog:index')),
+        (
+            'blog:post_detail',
+            anonymous,
+            reverse('blog:post_detail', args=(post.id,)),
+        ),
+        (
+            'blog:category_posts',
+            anonymous,
+            reverse('blog:category_posts', args=(post.category.slug,)),
+        ),
+        ('blog:profile', anonymous, reverse('blog:profile', args=(username,))),
+        (
+            'blog:profile (author)',
+            author,
+            reverse('blog:profile', args=(username,)),
+        ),
+        ('blog:create_post', author, reverse('blog:create_post')),
+        ('blog:edit_post', author, reverse('blog:edit_post', args=(post.id,))),
+        (
+            'blog:delete_post',
+            author,
+            reverse('blog:delete_post', args=(post.id,)),
+        ),
+        ('pages:about', anonymous, reverse('pages:about')),
+    ]
+
+
+@override_settings(DEBUG=False)
+def run_benchmarks(requests=20, warmup=2, cold=False):
+    before_request = get_cache().clear if cold else None
+    return [
+        measure(name, client, url, requests, warmup, before_request)
+        for name, client, url in get_targets()
+    ]
+
+
+def _run_worker(operation, deadline, latencies, errors):
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                operation()
+            except OperationalError as error:
+                errors.append(error)
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        connections.close_all()
+
+
+def _measure_workload(name, duration, readers, writers, read, write):
+    connections.close_all()
+    connection.ensure_connection()
+    journal_mode = read_pragmas(connection, ('journal_mode',))['journal_mode']
+    reads, writes, errors = [], [], []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(
+            target=_run_worker, args=(operation, deadline, latencies, errors)
+        )
+        for operation, latencies, count in (
+            (read, reads, readers),
+            (write, writes, writers),
+        )
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        'name': name,
+        'journal_mode': journal_mode,
+        'reads_per_s': round(len(reads) / duration, 1),
+        'writes_per_s': round(len(writes) / duration, 1),
+        'read_p95_ms': round(percentile(reads, 95), 3),
+        'write_p95_ms': round(percentile(writes, 95), 3),
+        'errors': len(errors),
+    }
+
+
+@override_settings(DEBUG=False)
+def run_sqlite_workload(duration=5, readers=4, writers=2):
+    if connection.vendor != 'sqlite':
+        raise ValueError('Замер рассчитан только на SQLite.')
+    post_ids = list(
+        Post.objects.order_by('-pub_date').values_list('id', flat=True)[
+            :1000
+        ]
+    )
+    author_id = get_user_model().objects.values_list('id', flat=True).first()
+    if not post_ids or author_id is None:
+        raise ValueError('Нет публикаций или пользователей для замеров.')
+    marker = f'benchmark {secrets.token_hex(4)}'
+
+    def read():
+        list(select_posts()[:PostFeedMixin.paginate_by])
+        list(
+            Comment.objects.filter(post=random.choice(post_ids))
+            .select_related('author')[:VisiblePostMixin.comments_per_page]
+        )
+
+    def write():
+        Comment.objects.create(
+            post_id=random.choice(post_ids), author_id=author_id, text=marker
+        )
+
+    profiles = (
+        ('sqlite defaults', DEFAULT_PRAGMAS),
+        ('tuned profile', settings.SQLITE_PRAGMAS),
+    )
+    results = []
+    try:
+        for name, pragmas in profiles:
+            with override_settings(SQLITE_PRAGMAS=pragmas):
+                results.append(
+                    _measure_workload(
+                        name, duration, readers, writers, read, write
+                    )
+                )
+    finally:
+        connections.close_all()
+        delete_comments(Comment.objects.filter(text=marker))
+    return results
@@ -0,0 +1,48 @@
+import secrets
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core.routers import reading_replica
+
+VERSION_PREFIX = 'version'
+ALL_FEEDS = 'feeds'
+
+
+def get_cache():
+    return caches[settings.POSTS_CACHE_ALIAS]
+
+
+def fill_cache(key, value, timeout):
+    if not reading_replica():
+        get_cache().set(key, value, timeout)
+
+
+def _version_key(name):
+    return f'{VERSION_PREFIX}:{name}'
+
+
+def get_versions(*names):
+    cache = get_cache()
+    keys = {name: _version_key(name) for name in names}
+    versions = cache.get_many(keys.values())
+    missing = {
+        key: secrets.token_hex(4)
+        for key in keys.values()
+        if key not in versions
+    }
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return {name: versions[key] for name, key in keys.items()}
+
+
+def bump_versions(*names):
+    get_cache().delete_many([_version_key(name) for name in names])
+
+
+def versioned_key(prefix, *names):
+    versions = get_versions(*names)
+    return ':'.join(
+        [prefix, *(f'{name}@{versions[name]}' for name in names)]
+    )
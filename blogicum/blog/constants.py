@@ -1 +1,3 @@
 DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+POST_PREVIEW_LENGTH = 300
@@ -0,0 +1,56 @@
+from django.conf import settings
+
+from .caching import ALL_FEEDS, fill_cache, get_cache, versioned_key
+from core.instrumentation import record_cache
+from core.utils import estimate_count
+
+INDEX_FEED = 'feed:index'
+NOT_CACHED = object()
+
+
+def category_feed(category_id):
+    return f'feed:category:{category_id}'
+
+
+def author_feed(author_id, with_drafts=False):
+    if with_drafts:
+        return f'feed:author:{author_id}:drafts'
+    return f'feed:author:{author_id}'
+
+
+def post_feeds(category_id, author_id):
+    return [
+        INDEX_FEED,
+        category_feed(category_id),
+        author_feed(author_id),
+        author_feed(author_id, with_drafts=True),
+    ]
+
+
+def count_posts(feed, queryset, timeout):
+    cache = get_cache()
+    key = versioned_key('count', ALL_FEEDS, feed)
+    count = cache.get(key)
+    record_cache(count is not None)
+    if count is not None:
+        return count
+    threshold = settings.POSTS_COUNT_APPROXIMATE_THRESHOLD
+    count = queryset.order_by()[:threshold + 1].count()
+    if count > threshold:
+        count = estimate_count(queryset.order_by()) or queryset.count()
+        timeout = settings.POSTS_COUNT_APPROXIMATE_TIMEOUT
+    fill_cache(key, count, timeout)
+    return count
+
+
+def newest_publication(feed, queryset, timeout):
+    cache = get_cache()
+    key = versioned_key('newest', ALL_FEEDS, feed)
+    newest = cache.get(key, NOT_CACHED)
+    record_cache(newest is not NOT_CACHED)
+    if newest is NOT_CACHED:
+        newest = queryset.order_by('-pub_date').values_list(
+            'pub_date', flat=True
+        ).first()
+        fill_cache(key, newest, timeout)
+    return newest
@@ -2,6 +2,7 @@ from django import forms
 
 from .constants import DATETIME_FORMAT
 from .models import Comment, Post
+from core.uploads import LimitedImageField
 
 
 class PostForm(forms.ModelForm):
@@ -11,6 +12,7 @@ class PostForm(forms.ModelForm):
             'is_published',
             'author',
         )
+        field_classes = {'image': LimitedImageField}
         widgets = {
             'pub_date': forms.DateTimeInput(
                 format=DATETIME_FORMAT,
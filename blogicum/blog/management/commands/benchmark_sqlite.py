@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.benchmarks import run_sqlite_workload
+from core.benchmark import dump_results
+
+COLUMNS = (
+    'journal_mode',
+    'reads_per_s',
+    'writes_per_s',
+    'read_p95_ms',
+    'write_p95_ms',
+    'errors',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает пропускную способность SQLite на смешанной нагрузке'
+        ' чтения и записи комментариев с настройками по умолчанию и с'
+        ' профилем SQLITE_PRAGMAS.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=5,
+            help='Длительность замера для каждого профиля, в секундах.',
+        )
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument('--output', help='Файл для результатов в JSON.')
+
+    def handle(self, *args, **options):
+        try:
+            results = run_sqlite_workload(
+                options['duration'], options['readers'], options['writers']
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        self.stdout.write(
+            f'{"profile":<18}' + ''.join(f'{name:>14}' for name in COLUMNS)
+        )
+        for result in results:
+            self.stdout.write(
+                f'{result["name"]:<18}'
+                + ''.join(f'{result[name]:>14}' for name in COLUMNS)
+            )
+        if options['output']:
+            dump_results(
+                options['output'],
+                results,
+                duration=options['duration'],
+                readers=options['readers'],
+                writers=options['writers'],
+            )
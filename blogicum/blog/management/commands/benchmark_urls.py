@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.benchmarks import run_benchmarks
+from core.benchmark import dump_results
+
+COLUMNS = (
+    'p50_ms', 'p95_ms', 'p99_ms', 'queries', 'sql_ms', 'template_ms'
+)
+
+
+class Command(BaseCommand):
+    help = 'Замеряет время ответа и число SQL-запросов для страниц блога.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Очищать кеш перед каждым запросом.',
+        )
+        parser.add_argument('--output', help='Файл для результатов в JSON.')
+
+    def handle(self, *args, **options):
+        try:
+            results = run_benchmarks(
+                options['requests'], options['warmup'], options['cold']
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        self.stdout.write(
+            f'{"url":<24}' + ''.join(f'{name:>13}' for name in COLUMNS)
+        )
+        for result in results:
+            self.stdout.write(
+                f'{result["name"]:<24}'
+                + ''.join(f'{result[name]:>13}' for name in COLUMNS)
+            )
+        if options['output']:
+            dump_results(
+                options['output'],
+                results,
+                requests=options['requests'],
+                cold=options['cold'],
+            )
@@ -0,0 +1,58 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from blog.models import Category, Comment, Post
+from core.utils import select_posts
+
+UserModel = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Выводит планы и время выполнения запросов лент публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--category', help='Slug категории.')
+        parser.add_argument('--author', help='Имя пользователя автора.')
+        parser.add_argument('--post', type=int, help='id публикации.')
+        parser.add_argument('--per-page', type=int, default=10)
+
+    def get_queries(self, options):
+        per_page = options['per_page']
+        category = Category.objects.filter(is_published=True)
+        if options['category']:
+            category = category.filter(slug=options['category'])
+        category = category.first()
+        author = UserModel.objects.filter(posts__isnull=False)
+        if options['author']:
+            author = UserModel.objects.filter(username=options['author'])
+        author = author.first()
+        post_id = options['post'] or (
+            Post.objects.order_by('-comment_count')
+            .values_list('id', flat=True)
+            .first()
+        )
+        return {
+            'index': select_posts(category__is_published=True)[:per_page],
+            'category': select_posts(category=category)[:per_page],
+            'profile': select_posts(
+                author=author, category__is_published=True
+            )[:per_page],
+            'profile (author)': select_posts(False, author=author)[:per_page],
+            'comments': Comment.objects.filter(post_id=post_id)
+            .select_related('author')
+            .order_by('created_at', 'id')[:20],
+        }
+
+    def handle(self, *args, **options):
+        for name, queryset in self.get_queries(options).items():
+            started = time.perf_counter()
+            rows = len(list(queryset))
+            elapsed = (time.perf_counter() - started) * 1000
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f'{name}: {rows} строк за {elapsed:.2f} мс'
+                )
+            )
+            self.stdout.write(queryset.explain())
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+from blog.thumbnails import generate_post_thumbnails
+from core.jobs import enqueue
+
+
+class Command(BaseCommand):
+    help = (
+        'Ставит в очередь создание миниатюр для публикаций, у которых их'
+        ' ещё нет.'
+    )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='').filter(
+            thumbnails={}
+        ).values_list('pk', 'image')
+        count = 0
+        for pk, image_name in posts.iterator():
+            enqueue(generate_post_thumbnails, pk, image_name)
+            count += 1
+        self.stdout.write(
+            self.style.SUCCESS(f'Поставлено в очередь публикаций: {count}')
+        )
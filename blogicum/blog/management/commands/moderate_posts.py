@@ -0,0 +1,136 @@
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.models import Category, Post
+from blog.moderation import (
+    move_posts,
+    publish_posts,
+    purge_authors,
+    unpublish_posts,
+)
+
+STEP_NAMES = {'posts': 'Публикации', 'comments': 'Комментарии'}
+
+
+class Command(BaseCommand):
+    help = (
+        'Массово публикует, снимает с публикации или переносит публикации'
+        ' и удаляет всё содержимое пользователя пакетами запросов.'
+    )
+
+    def add_arguments(self, parser):
+        action = parser.add_mutually_exclusive_group(required=True)
+        action.add_argument(
+            '--publish',
+            action='store_true',
+            help='Опубликовать отобранные публикации.',
+        )
+        action.add_argument(
+            '--unpublish',
+            action='store_true',
+            help='Снять отобранные публикации с публикации.',
+        )
+        action.add_argument(
+            '--move-to',
+            metavar='SLUG',
+            help='Перенести отобранные публикации в категорию.',
+        )
+        action.add_argument(
+            '--purge-user',
+            metavar='USERNAME',
+            help='Удалить все публикации и комментарии пользователя.',
+        )
+        parser.add_argument(
+            '--author',
+            metavar='USERNAME',
+            help='Отобрать публикации автора.',
+        )
+        parser.add_argument(
+            '--category',
+            metavar='SLUG',
+            help='Отобрать публикации категории.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.MODERATION_BATCH_SIZE,
+            help='Количество строк, изменяемых одним запросом.',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=settings.MODERATION_BATCH_PAUSE,
+            help='Пауза между пакетами, в секундах.',
+        )
+
+    def get_object(self, queryset, message, **lookup):
+        try:
+            return queryset.get(**lookup)
+        except queryset.model.DoesNotExist:
+            raise CommandError(message)
+
+    def select_posts(self, options):
+        queryset = Post.objects.all()
+        if options['author']:
+            queryset = queryset.filter(author__username=options['author'])
+        if options['category']:
+            queryset = queryset.filter(category__slug=options['category'])
+        return queryset
+
+    def progress(self, totals):
+        def report(step, processed):
+            if self.verbosity:
+                self.stdout.write(
+                    f'{STEP_NAMES[step]}: {processed} из {totals[step]}'
+                )
+
+        return report
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        batch_options = {
+            'batch_size': options['batch_size'],
+            'pause': options['pause'],
+        }
+        if options['purge_user']:
+            author = self.get_object(
+                get_user_model().objects.all(),
+                f'Пользователь {options["purge_user"]} не найден.',
+                username=options['purge_user'],
+            )
+            progress = self.progress({
+                'posts': author.posts.count(),
+                'comments': author.comments.count(),
+            })
+            posts, comments = purge_authors(
+                [author.id], progress=progress, **batch_options
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f'Удалено публикаций: {posts}, комментариев: {comments}'
+            ))
+            return
+        queryset = self.select_posts(options)
+        if options['move_to']:
+            category = self.get_object(
+                Category.objects.all(),
+                f'Категория {options["move_to"]} не найдена.',
+                slug=options['move_to'],
+            )
+            queryset = queryset.exclude(category=category)
+            action = partial(move_posts, category=category)
+        elif options['publish']:
+            queryset = queryset.filter(is_published=False)
+            action = publish_posts
+        else:
+            queryset = queryset.filter(is_published=True)
+            action = unpublish_posts
+        progress = self.progress({'posts': queryset.count()})
+        updated = action(
+            queryset, progress=partial(progress, 'posts'), **batch_options
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f'Изменено публикаций: {updated}')
+        )
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.caching import get_cache
+from blog.schedule import PublicationScheduler, release_due_posts
+
+
+class Command(BaseCommand):
+    help = (
+        'Сбрасывает кеши лент для отложенных публикаций, время которых'
+        ' наступило.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--watch',
+            action='store_true',
+            help='Работать постоянно, просыпаясь к следующей публикации.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=settings.POSTS_SCHEDULER_INTERVAL,
+            help='Максимальная пауза между проверками, в секундах.',
+        )
+
+    def handle(self, *args, **options):
+        if isinstance(get_cache(), LocMemCache):
+            raise CommandError(
+                'Кеш лент хранится в памяти процесса: команда не сможет'
+                ' сбросить его у веб-сервера. Укажите в POSTS_CACHE_ALIAS'
+                ' общий кеш (Memcached, Redis, база данных) или включите'
+                ' POSTS_SCHEDULER_ENABLED.'
+            )
+        if not options['watch']:
+            released = release_due_posts()
+            self.stdout.write(f'Опубликовано постов: {len(released)}')
+            return
+        try:
+            PublicationScheduler(options['interval']).run()
+        except KeyboardInterrupt:
+            pass
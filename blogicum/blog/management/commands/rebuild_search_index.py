@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from blog.models import Post
+from blog.search import rebuild_index, search_available
+
+
+class Command(BaseCommand):
+    help = 'Перестраивает полнотекстовый индекс публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Количество публикаций, индексируемых за один запрос.',
+        )
+
+    def handle(self, *args, **options):
+        if not search_available():
+            raise CommandError(
+                'Полнотекстовый индекс недоступен: нужна SQLite с FTS5 и'
+                ' применённые миграции.'
+            )
+        with transaction.atomic():
+            indexed = rebuild_index(
+                Post.objects.all(), batch_size=options['batch_size']
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f'Проиндексировано публикаций: {indexed}')
+        )
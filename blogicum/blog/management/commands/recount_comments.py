@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+from blog.moderation import comment_totals
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает количество комментариев у публикаций.'
+
+    def handle(self, *args, **options):
+        updated = Post.objects.update(comment_count=comment_totals())
+        self.stdout.write(
+            self.style.SUCCESS(f'Пересчитано публикаций: {updated}')
+        )
@@ -0,0 +1,169 @@
+import random
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from blog.caching import get_cache
+from blog.models import Category, Comment, Location, Post
+from blog.search import search_available
+
+UserModel = get_user_model()
+
+WORDS = (
+    'блог город море утро вечер дорога поезд книга кофе музыка снег лето'
+    ' осень весна зима река лес горы друг семья работа проект код идея'
+    ' путешествие фото кино театр выставка рецепт ужин завтрак прогулка'
+    ' парк улица дом окно свет небо солнце дождь ветер история новость'
+    ' заметка мысль вопрос ответ встреча праздник концерт спорт бег велосипед'
+    ' сад цветы кошка собака чай письмо память мечта план'
+).split()
+
+
+class Command(BaseCommand):
+    help = 'Заполняет базу синтетическими данными для нагрузочных замеров.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--locations', type=int, default=50)
+        parser.add_argument('--posts', type=int, default=100_000)
+        parser.add_argument('--comments', type=int, default=300_000)
+        parser.add_argument(
+            '--unpublished',
+            type=float,
+            default=0.05,
+            help='Доля публикаций, снятых с публикации.',
+        )
+        parser.add_argument(
+            '--scheduled',
+            type=float,
+            default=0.02,
+            help='Доля отложенных публикаций с датой в будущем.',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument(
+            '--now',
+            default=None,
+            help='Опорная дата в формате ISO 8601, от которой считаются даты.',
+        )
+
+    def words(self, low, high):
+        return ' '.join(self.rng.choices(WORDS, k=self.rng.randint(low, high)))
+
+    def create_in_batches(self, model, total, build):
+        batch_size = self.batch_size
+        last_id = model.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        for start in range(0, total, batch_size):
+            size = min(batch_size, total - start)
+            with transaction.atomic():
+                model.objects.bulk_create(
+                    [build(start + number) for number in range(size)],
+                    batch_size=batch_size,
+                )
+            self.stdout.write(
+                f'{model._meta.verbose_name_plural}: {start + size}/{total}'
+            )
+        return list(
+            model.objects.filter(id__gt=last_id).values_list('id', flat=True)
+        )
+
+    def reference_date(self, value):
+        if value is None:
+            return timezone.now()
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            raise CommandError(f'Некорректная дата --now: {value}.')
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return moment
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        now = self.reference_date(options['now'])
+        prefix = f'seed{options["seed"]}'
+        seeded = UserModel.objects.filter(username__startswith=f'{prefix}_')
+        if seeded.exists():
+            raise CommandError(
+                f'Данные с --seed {options["seed"]} уже есть в базе.'
+            )
+        password = make_password(None)
+
+        user_ids = self.create_in_batches(
+            UserModel,
+            options['users'],
+            lambda number: UserModel(
+                username=f'{prefix}_user{number}',
+                password=password,
+                date_joined=now,
+            ),
+        )
+        category_ids = self.create_in_batches(
+            Category,
+            options['categories'],
+            lambda number: Category(
+                title=self.words(1, 3).capitalize(),
+                description=self.words(10, 30),
+                slug=f'{prefix}-category{number}'.replace('_', '-'),
+                is_published=self.rng.random() > 0.1,
+            ),
+        )
+        location_ids = self.create_in_batches(
+            Location,
+            options['locations'],
+            lambda number: Location(
+                name=self.words(1, 2).capitalize(),
+                is_published=self.rng.random() > 0.1,
+            ),
+        )
+
+        def build_post(number):
+            roll = self.rng.random()
+            if roll < options['scheduled']:
+                pub_date = now + timedelta(
+                    seconds=self.rng.randint(60, 30 * 24 * 60 * 60)
+                )
+            else:
+                pub_date = now - timedelta(
+                    seconds=self.rng.randint(60, 3 * 365 * 24 * 60 * 60)
+                )
+            return Post(
+                title=self.words(2, 8).capitalize(),
+                text=self.words(20, 200),
+                pub_date=pub_date,
+                is_published=(
+                    roll >= options['scheduled'] + options['unpublished']
+                    or roll < options['scheduled']
+                ),
+                author_id=self.rng.choice(user_ids),
+                category_id=self.rng.choice(category_ids),
+                location_id=(
+                    self.rng.choice(location_ids)
+                    if location_ids and self.rng.random() > 0.3 else None
+                ),
+            )
+
+        post_ids = self.create_in_batches(Post, options['posts'], build_post)
+        if post_ids:
+            self.create_in_batches(
+                Comment,
+                options['comments'],
+                lambda number: Comment(
+                    text=self.words(3, 40),
+                    post_id=self.rng.choice(post_ids),
+                    author_id=self.rng.choice(user_ids),
+                ),
+            )
+        call_command('recount_comments', stdout=self.stdout)
+        if search_available():
+            call_command('rebuild_search_index', stdout=self.stdout)
+        get_cache().clear()
+        self.stdout.write(self.style.SUCCESS('Данные созданы.'))
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.16 on 2026-10-18 20:32
+
+import blog.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostSearch',
+            fields=[
+                ('post', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_document', serialize=False, to='blog.post', verbose_name='Публикация')),
+                ('title', models.TextField(verbose_name='Заголовок')),
+                ('body', models.TextField(verbose_name='Текст')),
+                ('document', blog.search.FullTextField(db_column='blog_post_search', editable=False, verbose_name='Документ')),
+            ],
+            options={
+                'verbose_name': 'поисковый документ',
+                'verbose_name_plural': 'Поисковые документы',
+                'db_table': 'blog_post_search',
+                'managed': False,
+            },
+        ),
+    ]
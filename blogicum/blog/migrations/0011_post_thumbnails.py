@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-18 20:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_post_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='thumbnails',
+            field=models.JSONField(default=dict, editable=False, null=True, verbose_name='Миниатюры'),
+        ),
+    ]
@@ -1,38 +1,259 @@
+import hashlib
+from functools import partial
+
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.paginator import InvalidPage
+from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 
+from .caching import (
+    ALL_FEEDS,
+    fill_cache,
+    get_cache,
+    get_versions,
+    versioned_key,
+)
+from .feeds import INDEX_FEED, count_posts, newest_publication
 from .models import Comment, Post
+from .schedule import publication_timeout
+from core.instrumentation import record_cache
+from core.paginators import CountedPaginator, CursorPaginator
+from core.routers import reading_replica
+from core.utils import filter_posts, select_posts
 
 
-class PostListMixin:
-    model = Post
+class ConditionalGetMixin:
+    def get_etag_parts(self):
+        return []
+
+    def get_etag(self):
+        request = self.request
+        parts = [
+            request.get_full_path(),
+            request.user.pk,
+            request.user.get_username(),
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME),
+            *self.get_etag_parts(),
+        ]
+        digest = hashlib.md5('|'.join(map(str, parts)).encode()).hexdigest()
+        return quote_etag(digest)
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or reading_replica():
+            return super().dispatch(request, *args, **kwargs)
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+        if response.status_code not in (200, 304):
+            return response
+        response['ETag'] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+class CursorPaginationMixin:
+    cursor_kwarg = 'cursor'
+    cursor_ordering = ('-pub_date', '-id')
+
+    def use_cursor_pagination(self):
+        if self.cursor_kwarg in self.request.GET:
+            return True
+        return (
+            settings.POSTS_CURSOR_PAGINATION
+            and self.page_kwarg not in self.request.GET
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(queryset, page_size, self.cursor_ordering)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class FeedPageCacheMixin:
+    def is_page_cacheable(self):
+        return not self.request.user.is_authenticated
+
+    def get_page_cache_key(self):
+        page = self.request.GET.get(self.page_kwarg, '')
+        cursor = self.request.GET.get(self.cursor_kwarg, '')
+        digest = hashlib.md5(
+            f'{self.request.path}?{page}&{cursor}'.encode()
+        ).hexdigest()
+        feed_key = versioned_key('page', *self.get_version_names())
+        return f'{feed_key}:{digest}'
+
+    def get_page_cache_timeout(self):
+        return self.get_publication_timeout(settings.POSTS_PAGE_CACHE_TIMEOUT)
+
+    def get(self, request, *args, **kwargs):
+        if not self.is_page_cacheable():
+            return super().get(request, *args, **kwargs)
+        cache = get_cache()
+        key = self.get_page_cache_key()
+        response = cache.get(key)
+        record_cache(response is not None)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+            timeout = self.get_page_cache_timeout()
+            response.add_post_render_callback(
+                lambda rendered: fill_cache(key, rendered, timeout)
+            )
+        return response
+
+
+class PostFeedMixin(
+    ConditionalGetMixin, FeedPageCacheMixin, CursorPaginationMixin
+):
     paginate_by = 10
+    paginator_class = CountedPaginator
+    newest = None
+
+    def get_feed(self):
+        return INDEX_FEED
+
+    def get_post_filters(self):
+        return {}
+
+    def only_published(self):
+        return True
+
+    def get_posts(self):
+        return select_posts(self.only_published(), **self.get_post_filters())
+
+    def get_publication_timeout(self, timeout):
+        if not self.only_published():
+            return timeout
+        return publication_timeout(
+            self.get_feed(),
+            filter_posts(False, **self.get_post_filters()),
+            timeout,
+        )
+
+    def get_newest_publication(self):
+        if self.newest is None:
+            self.newest = newest_publication(
+                self.get_feed(),
+                filter_posts(self.only_published(), **self.get_post_filters()),
+                self.get_publication_timeout(
+                    settings.POSTS_PAGE_CACHE_TIMEOUT
+                ),
+            ) or False
+        return self.newest or None
+
+    def get_version_names(self):
+        return [ALL_FEEDS, self.get_feed()]
+
+    def get_etag_parts(self):
+        versions = get_versions(*self.get_version_names())
+        return [*versions.values(), self.get_newest_publication()]
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        count_func = partial(
+            count_posts,
+            self.get_feed(),
+            filter_posts(self.only_published(), **self.get_post_filters()),
+            self.get_publication_timeout(settings.POSTS_COUNT_TIMEOUT),
+        )
+        return super().get_paginator(
+            queryset, per_page, count_func=count_func, **kwargs
+        )
 
 
-class PostActionsMixin(LoginRequiredMixin):
+class PostListMixin(PostFeedMixin):
+    model = Post
+
+    def get_queryset(self):
+        return self.get_posts()
+
+
+class VisiblePostMixin(ConditionalGetMixin):
     model = Post
-    template_name = 'blog/create.html'
     post_pk = 'pk'
+    comments_per_page = 20
+    comments_cursor_kwarg = 'comments'
+
+    def get_queryset(self):
+        return select_posts(only_published=False, projection='full')
 
     def dispatch(self, request, *args, **kwargs):
-        post = self.get_object()
-        if post.author != request.user:
-            return redirect('blog:post_detail', pk=kwargs[self.post_pk])
+        self.object = self.get_object()
+        if (
+            not (
+                self.object.is_published
+                and self.object.category is not None
+                and self.object.category.is_published
+                and self.object.pub_date <= timezone.now()
+            )
+            and request.user.id != self.object.author_id
+        ):
+            raise Http404
         return super().dispatch(request, *args, **kwargs)
 
+    def get_etag_parts(self):
+        post = self.object
+        versions = get_versions(
+            ALL_FEEDS,
+            f'post:{post.id}',
+            f'category:{post.category_id}',
+            f'location:{post.location_id}',
+            f'user:{post.author_id}',
+        )
+        return [
+            *versions.values(),
+            post.updated_at,
+            post.comment_count,
+        ]
 
-class CommentActionsMixin:
-    model = Comment
-    template_name = 'blog/comment.html'
-    post_pk = 'post_pk'
+    def get_comments_page(self):
+        paginator = CursorPaginator(
+            self.object.comments.select_related('author'),
+            self.comments_per_page,
+            ordering=('created_at', 'id'),
+        )
+        try:
+            return paginator.page(
+                self.request.GET.get(self.comments_cursor_kwarg)
+            )
+        except InvalidPage as error:
+            raise Http404(str(error))
+
+
+class OwnedObjectMixin:
+    object = None
+
+    def get_object(self, queryset=None):
+        if self.object is None:
+            self.object = super().get_object(queryset)
+        return self.object
 
     def dispatch(self, request, *args, **kwargs):
-        comment = self.get_object()
-        if request.user != comment.author:
+        if self.get_object().author_id != request.user.id:
             return redirect('blog:post_detail', pk=kwargs[self.post_pk])
         return super().dispatch(request, *args, **kwargs)
 
+
+class PostActionsMixin(OwnedObjectMixin, LoginRequiredMixin):
+    model = Post
+    template_name = 'blog/create.html'
+    post_pk = 'pk'
+
+
+class CommentActionsMixin(OwnedObjectMixin):
+    model = Comment
+    template_name = 'blog/comment.html'
+    post_pk = 'post_pk'
+
     def get_success_url(self):
         return reverse(
             'blog:post_detail', kwargs={'pk': self.kwargs[self.post_pk]}
@@ -1,5 +1,9 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import DEFERRED
+from django.utils import timezone
+
+from .search import SEARCH_TABLE, FullTextField
 
 UserModel = get_user_model()
 
@@ -67,6 +71,12 @@ class Post(PublishedModel):
         upload_to='posts_images',
         verbose_name='Изображение',
     )
+    thumbnails = models.JSONField(
+        default=dict,
+        null=True,
+        editable=False,
+        verbose_name='Миниатюры',
+    )
     pub_date = models.DateTimeField(
         verbose_name='Дата и время публикации',
         help_text=(
@@ -95,15 +105,62 @@ class Post(PublishedModel):
         related_name='posts',
         verbose_name='Категория',
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев',
+    )
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+        verbose_name='Изменено',
+    )
 
     class Meta:
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_published_feed_idx',
+            ),
+            models.Index(
+                fields=('author', '-pub_date', '-id'),
+                name='post_author_feed_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_category_feed_idx',
+            ),
+        )
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = (value for value in values if value is not DEFERRED)
+        instance._loaded_values = dict(zip(field_names, loaded))
+        return instance
+
+    def save(self, *args, **kwargs):
+        self.updated_at = timezone.now()
+        super().save(*args, **kwargs)
+        self._loaded_values = {}
+        for field in self._meta.concrete_fields:
+            if field.attname in self.__dict__:
+                value = self.__dict__[field.attname]
+                self._loaded_values[field.attname] = getattr(
+                    value, 'name', value
+                )
+
+    def loaded_value(self, attname):
+        return getattr(self, '_loaded_values', {}).get(attname)
+
 
 class Comment(models.Model):
     text = models.TextField(verbose_name='Текст комментария')
@@ -126,8 +183,37 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ('created_at',)
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at', 'id'),
+                name='comment_post_created_idx',
+            ),
+        )
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
 
     def __str__(self):
         return self.text
+
+
+class PostSearch(models.Model):
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column='rowid',
+        db_constraint=False,
+        related_name='search_document',
+        verbose_name='Публикация',
+    )
+    title = models.TextField(verbose_name='Заголовок')
+    body = models.TextField(verbose_name='Текст')
+    document = FullTextField(
+        db_column=SEARCH_TABLE, editable=False, verbose_name='Документ'
+    )
+
+    class Meta:
+        managed = False
+        db_table = SEARCH_TABLE
+        verbose_name = 'поисковый документ'
+        verbose_name_plural = 'Поисковые документы'
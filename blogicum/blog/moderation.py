@@ -0,0 +1,155 @@
+import time
+from functools import partial
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .caching import ALL_FEEDS, bump_versions
+from .models import Comment, Post
+from .search import search_available, unindex_posts
+from .thumbnails import delete_posts_thumbnails
+from core.jobs import enqueue
+
+
+def comment_totals():
+    comments = (
+        Comment.objects.filter(post=OuterRef('pk'))
+        .order_by()
+        .values('post')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return Coalesce(Subquery(comments), 0)
+
+
+def batched_ids(queryset, batch_size=None):
+    batch_size = batch_size or settings.MODERATION_BATCH_SIZE
+    ids = queryset.order_by('pk').values_list('pk', flat=True)
+    last_id = None
+    while True:
+        page = ids if last_id is None else ids.filter(pk__gt=last_id)
+        batch = list(page[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
+
+
+def delete_rows(model, using, column, ids):
+    connection = connections[using]
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(column)
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {table} WHERE {column} IN ({placeholders})', ids
+        )
+
+
+def run_in_batches(
+        queryset, apply, batch_size=None, pause=None, progress=None
+):
+    pause = settings.MODERATION_BATCH_PAUSE if pause is None else pause
+    processed = 0
+    for ids in batched_ids(queryset, batch_size):
+        if processed and pause:
+            time.sleep(pause)
+        with transaction.atomic(using=queryset.db):
+            post_ids = apply(ids)
+        bump_versions(*(f'post:{post_id}' for post_id in post_ids))
+        processed += len(ids)
+        if progress is not None:
+            progress(processed)
+    if processed:
+        bump_versions(ALL_FEEDS)
+    return processed
+
+
+def update_posts(queryset, values, **options):
+    posts = Post.objects.using(queryset.db)
+    values = {**values, 'updated_at': timezone.now()}
+
+    def apply(ids):
+        posts.filter(pk__in=ids).update(**values)
+        return ids
+
+    return run_in_batches(queryset, apply, **options)
+
+
+def publish_posts(queryset, **options):
+    return update_posts(
+        queryset.filter(is_published=False), {'is_published': True},
+        **options,
+    )
+
+
+def unpublish_posts(queryset, **options):
+    return update_posts(
+        queryset.filter(is_published=True), {'is_published': False},
+        **options,
+    )
+
+
+def move_posts(queryset, category, **options):
+    return update_posts(
+        queryset.exclude(category=category), {'category': category},
+        **options,
+    )
+
+
+def delete_posts(queryset, **options):
+    using = queryset.db
+
+    def apply(ids):
+        posts = Post.objects.using(using).filter(pk__in=ids)
+        images = list(
+            posts.exclude(image='').values_list('image', flat=True)
+        )
+        delete_rows(Comment, using, 'post_id', ids)
+        delete_rows(Post, using, 'id', ids)
+        if search_available(using):
+            unindex_posts(connections[using], ids)
+        if images:
+            enqueue(delete_posts_thumbnails, images)
+        return ids
+
+    return run_in_batches(queryset, apply, **options)
+
+
+def delete_comments(queryset, **options):
+    using = queryset.db
+
+    def apply(ids):
+        comments = Comment.objects.using(using).filter(pk__in=ids)
+        post_ids = list(
+            comments.order_by().values_list('post', flat=True).distinct()
+        )
+        delete_rows(Comment, using, 'id', ids)
+        Post.objects.using(using).filter(pk__in=post_ids).update(
+            comment_count=comment_totals(), updated_at=timezone.now()
+        )
+        return post_ids
+
+    return run_in_batches(queryset, apply, **options)
+
+
+def purge_authors(author_ids, progress=None, **options):
+    steps = (
+        ('posts', delete_posts, Post.objects.filter(author__in=author_ids)),
+        (
+            'comments',
+            delete_comments,
+            Comment.objects.filter(author__in=author_ids),
+        ),
+    )
+    return [
+        delete(
+            queryset,
+            progress=partial(progress, step) if progress else None,
+            **options,
+        )
+        for step, delete, queryset in steps
+    ]
@@ -0,0 +1,96 @@
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Min
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .caching import ALL_FEEDS, fill_cache, get_cache, versioned_key
+from .models import Post
+from core.instrumentation import record_cache
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_KEY = 'schedule:watermark'
+NOTHING_SCHEDULED = 'nothing-scheduled'
+
+post_published = Signal()
+
+
+def _scheduled(queryset, now):
+    return queryset.filter(is_published=True, pub_date__gt=now).aggregate(
+        next_pub_date=Min('pub_date')
+    )['next_pub_date']
+
+
+def next_publication(feed, queryset):
+    cache = get_cache()
+    key = versioned_key('schedule', ALL_FEEDS, feed)
+    now = timezone.now()
+    next_pub_date = cache.get(key)
+    record_cache(next_pub_date is not None)
+    if next_pub_date == NOTHING_SCHEDULED:
+        return None
+    if next_pub_date is None or next_pub_date <= now:
+        next_pub_date = _scheduled(queryset, now)
+        fill_cache(key, next_pub_date or NOTHING_SCHEDULED, None)
+    return next_pub_date
+
+
+def publication_timeout(feed, queryset, timeout):
+    next_pub_date = next_publication(feed, queryset)
+    if next_pub_date is None:
+        return timeout
+    seconds = (next_pub_date - timezone.now()).total_seconds()
+    return max(0, min(timeout, int(seconds) + 1))
+
+
+def release_due_posts(now=None):
+    cache = get_cache()
+    now = now or timezone.now()
+    watermark = cache.get(WATERMARK_KEY) or now - timedelta(
+        seconds=settings.POSTS_SCHEDULE_LOOKBACK
+    )
+    released = list(
+        Post.objects.filter(
+            is_published=True, pub_date__gt=watermark, pub_date__lte=now
+        ).values('id', 'category_id', 'author_id', 'pub_date')
+    )
+    for post in released:
+        post_published.send(sender=Post, **post)
+    cache.set(WATERMARK_KEY, now, timeout=None)
+    return released
+
+
+class PublicationScheduler(threading.Thread):
+    def __init__(self, interval):
+        super().__init__(name='publication-scheduler', daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def seconds_to_wait(self):
+        next_pub_date = _scheduled(Post.objects.all(), timezone.now())
+        if next_pub_date is None:
+            return self.interval
+        seconds = (next_pub_date - timezone.now()).total_seconds()
+        return max(0, min(self.interval, seconds))
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                release_due_posts()
+                wait = self.seconds_to_wait()
+            except Exception:
+                logger.exception('Не удалось опубликовать отложенные посты')
+                wait = self.interval
+            self.stopped.wait(wait)
+
+    def stop(self):
+        self.stopped.set()
+
+
+def start_scheduler():
+    if settings.POSTS_SCHEDULER_ENABLED:
+        PublicationScheduler(settings.POSTS_SCHEDULER_INTERVAL).start()
@@ -0,0 +1,214 @@
+import re
+from functools import lru_cache
+
+from django.db import connections, models
+from django.db.models import Lookup, Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = 'blog_post_search'
+TITLE_WEIGHT = 5.0
+TEXT_WEIGHT = 1.0
+MAX_QUERY_TERMS = 10
+
+WORD_RE = re.compile(r'[0-9a-zа-яё]+')
+VOWELS = 'аеиоуыэюя'
+
+PERFECTIVE_GERUND = re.compile(
+    r'(ив|ивши|ившись|ыв|ывши|ывшись|(?<=[ая])(в|вши|вшись))$'
+)
+REFLEXIVE = re.compile(r'(ся|сь)$')
+ADJECTIVE = re.compile(
+    r'(ее|ие|ые|ое|ими|ыми|ей|ий|ый|ой|ем|им|ым|ом|его|ого|ему|ому|их|ых'
+    r'|ую|юю|ая|яя|ою|ею)$'
+)
+PARTICIPLE = re.compile(r'(ивш|ывш|ующ|(?<=[ая])(ем|нн|вш|ющ|щ))$')
+VERB = re.compile(
+    r'(ила|ыла|ена|ейте|уйте|ите|или|ыли|ей|уй|ил|ыл|им|ым|ен|ило|ыло|ено'
+    r'|ят|ует|уют|ит|ыт|ены|ить|ыть|ишь|ую|ю'
+    r'|(?<=[ая])(ла|на|ете|йте|ли|й|л|ем|н|ло|но|ет|ют|ны|ть|ешь|нно))$'
+)
+NOUN = re.compile(
+    r'(а|ев|ов|ие|ье|е|иями|ями|ами|еи|ии|и|ией|ей|ой|ий|й|иям|ям|ием|ем'
+    r'|ам|ом|о|у|ах|иях|ях|ы|ь|ию|ью|ю|ия|ья|я)$'
+)
+DERIVATIONAL = re.compile(r'ость?$')
+SUPERLATIVE = re.compile(r'(ейше|ейш)$')
+I_ENDING = re.compile(r'и$')
+
+
+class FullTextField(models.TextField):
+    def from_db_value(self, value, expression, connection):
+        return None
+
+    def get_db_prep_save(self, value, connection):
+        return None
+
+
+@FullTextField.register_lookup
+class Match(Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', [*lhs_params, *rhs_params]
+
+
+def _region_start(word, start=0):
+    for position in range(start + 1, len(word)):
+        if word[position] not in VOWELS and word[position - 1] in VOWELS:
+            return position + 1
+    return len(word)
+
+
+def _cut(pattern, word):
+    stripped = pattern.sub('', word, count=1)
+    return stripped, stripped != word
+
+
+@lru_cache(maxsize=100_000)
+def stem(word):
+    if not re.search(f'[{VOWELS}]', word):
+        return word
+    rv_start = next(
+        position + 1
+        for position, letter in enumerate(word)
+        if letter in VOWELS
+    )
+    prefix, rv = word[:rv_start], word[rv_start:]
+    rv, found = _cut(PERFECTIVE_GERUND, rv)
+    if not found:
+        rv, _ = _cut(REFLEXIVE, rv)
+        rv, found = _cut(ADJECTIVE, rv)
+        if found:
+            rv, _ = _cut(PARTICIPLE, rv)
+        else:
+            rv, found = _cut(VERB, rv)
+            if not found:
+                rv, _ = _cut(NOUN, rv)
+    rv, _ = _cut(I_ENDING, rv)
+    word = prefix + rv
+    r2_start = _region_start(word, _region_start(word))
+    if DERIVATIONAL.search(word[r2_start:]):
+        word = DERIVATIONAL.sub('', word)
+    rv = word[rv_start:]
+    if rv.endswith('нн'):
+        rv = rv[:-1]
+    else:
+        rv, found = _cut(SUPERLATIVE, rv)
+        if found and rv.endswith('нн'):
+            rv = rv[:-1]
+        elif rv.endswith('ь'):
+            rv = rv[:-1]
+    return word[:rv_start] + rv
+
+
+def tokenize(text):
+    return [
+        stem(word.replace('ё', 'е'))
+        for word in WORD_RE.findall(text.lower())
+    ]
+
+
+def normalize(text):
+    return ' '.join(tokenize(text))
+
+
+def match_expression(query):
+    terms = tokenize(query)[:MAX_QUERY_TERMS]
+    return ' '.join(f'"{term}"' for term in terms)
+
+
+@lru_cache(maxsize=None)
+def _has_search_table(alias):
+    connection = connections[alias]
+    if connection.vendor != 'sqlite':
+        return False
+    return SEARCH_TABLE in connection.introspection.table_names()
+
+
+def search_available(alias='default'):
+    return _has_search_table(alias)
+
+
+def reset_search_availability():
+    _has_search_table.cache_clear()
+
+
+def index_is_empty(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT 1 FROM {SEARCH_TABLE} LIMIT 1')
+        return cursor.fetchone() is None
+
+
+def index_rows(connection, rows):
+    if not rows:
+        return
+    params = []
+    for post_id, title, text in rows:
+        params += [post_id, normalize(title), normalize(text)]
+    values = ', '.join(['(%s, %s, %s)'] * len(rows))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE}(rowid, title, body) VALUES {values}',
+            params,
+        )
+
+
+def unindex_posts(connection, post_ids):
+    post_ids = list(post_ids)
+    if not post_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(post_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})',
+            post_ids,
+        )
+
+
+def index_post(post_id, title, text, using='default'):
+    if not search_available(using):
+        return
+    connection = connections[using]
+    unindex_posts(connection, [post_id])
+    index_rows(connection, [(post_id, title, text)])
+
+
+def unindex_post(post_id, using='default'):
+    if search_available(using):
+        unindex_posts(connections[using], [post_id])
+
+
+def rebuild_index(queryset, batch_size=2000):
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+    rows = queryset.order_by('id').values_list('id', 'title', 'text')
+    batch = []
+    indexed = 0
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) == batch_size:
+            index_rows(connection, batch)
+            indexed += len(batch)
+            batch = []
+    index_rows(connection, batch)
+    return indexed + len(batch)
+
+
+def search_posts(queryset, query):
+    expression = match_expression(query)
+    if not expression:
+        return queryset.none()
+    if not search_available(queryset.db):
+        condition = Q()
+        for word in WORD_RE.findall(query.lower())[:MAX_QUERY_TERMS]:
+            condition &= Q(title__icontains=word) | Q(text__icontains=word)
+        return queryset.filter(condition)
+    rank = RawSQL(f'bm25({SEARCH_TABLE}, {TITLE_WEIGHT}, {TEXT_WEIGHT})', ())
+    return (
+        queryset.filter(search_document__document__match=expression)
+        .annotate(rank=rank)
+        .order_by('rank', '-pub_date')
+    )
@@ -0,0 +1,175 @@
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models import F
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .caching import ALL_FEEDS, bump_versions
+from .feeds import post_feeds
+from .models import Category, Comment, Location, Post
+from .schedule import post_published
+from .search import (
+    index_is_empty,
+    index_post,
+    rebuild_index,
+    reset_search_availability,
+    search_available,
+    unindex_post,
+)
+from .thumbnails import delete_thumbnails, generate_post_thumbnails
+from core.jobs import enqueue
+
+UserModel = get_user_model()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_feeds(sender, instance, **kwargs):
+    feeds = {
+        *post_feeds(instance.category_id, instance.author_id),
+        *post_feeds(
+            instance.loaded_value('category_id'),
+            instance.loaded_value('author_id'),
+        ),
+    }
+    bump_versions(*feeds, f'post:{instance.pk}')
+
+
+def _image_name(instance):
+    image = instance.__dict__.get('image')
+    return getattr(image, 'name', image) or ''
+
+
+@receiver(post_save, sender=Post)
+def refresh_post_thumbnails(sender, instance, raw=False, **kwargs):
+    if raw or 'image' not in instance.__dict__:
+        return
+    image_name = _image_name(instance)
+    saved_image = instance.loaded_value('image') or ''
+    if image_name == saved_image:
+        return
+    if saved_image:
+        delete_thumbnails(saved_image, instance.image.storage)
+    instance.thumbnails = {}
+    Post.objects.filter(pk=instance.pk).update(thumbnails={})
+    if image_name:
+        enqueue(generate_post_thumbnails, instance.pk, image_name)
+
+
+@receiver(post_delete, sender=Post)
+def delete_post_thumbnails(sender, instance, **kwargs):
+    saved_image = instance.loaded_value('image')
+    if saved_image:
+        delete_thumbnails(saved_image, instance.image.storage)
+
+
+@receiver(post_save, sender=Post)
+def index_post_text(sender, instance, using, raw=False, **kwargs):
+    if raw:
+        return
+    if {'title', 'text'} & instance.get_deferred_fields():
+        title, text = Post.objects.using(using).values_list(
+            'title', 'text'
+        ).get(pk=instance.pk)
+    else:
+        title, text = instance.title, instance.text
+    index_post(instance.pk, title, text, using)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post_text(sender, instance, using, **kwargs):
+    unindex_post(instance.pk, using)
+
+
+@receiver(post_migrate)
+def refresh_search_availability(sender, **kwargs):
+    reset_search_availability()
+
+
+@receiver(post_migrate)
+def populate_search_index(sender, using, **kwargs):
+    if sender.name != 'blog' or not search_available(using):
+        return
+    posts = Post.objects.using(using)
+    if posts.exists() and index_is_empty(connections[using]):
+        rebuild_index(posts)
+
+
+@receiver(post_published, sender=Post)
+def invalidate_published_post_feeds(sender, category_id, author_id, **kwargs):
+    bump_versions(*post_feeds(category_id, author_id))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_all_feeds(sender, instance, **kwargs):
+    bump_versions(ALL_FEEDS, f'category:{instance.pk}')
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location(sender, instance, **kwargs):
+    bump_versions(ALL_FEEDS, f'location:{instance.pk}')
+
+
+@receiver(pre_save, sender=UserModel)
+def remember_username(sender, instance, using, update_fields=None, **kwargs):
+    instance._saved_username = None
+    if instance._state.adding:
+        return
+    if update_fields is not None and 'username' not in update_fields:
+        return
+    instance._saved_username = UserModel.objects.using(using).filter(
+        pk=instance.pk
+    ).values_list('username', flat=True).first()
+
+
+@receiver(post_save, sender=UserModel)
+def invalidate_author(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and update_fields <= {'last_login'}:
+        return
+    names = [f'user:{instance.pk}']
+    saved_username = instance._saved_username
+    if saved_username is not None and saved_username != instance.username:
+        names.append(ALL_FEEDS)
+    bump_versions(*names)
+
+
+def invalidate_commented_post(post_id):
+    post = Post.objects.filter(pk=post_id).values(
+        'category_id', 'author_id'
+    ).first()
+    if post is not None:
+        bump_versions(
+            f'post:{post_id}',
+            *post_feeds(post['category_id'], post['author_id']),
+        )
+
+
+@receiver(post_save, sender=Comment)
+def update_commented_post(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if not created:
+        Post.objects.filter(pk=instance.post_id).update(
+            updated_at=timezone.now()
+        )
+        return
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=F('comment_count') + 1, updated_at=timezone.now()
+    )
+    invalidate_commented_post(instance.post_id)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1, updated_at=timezone.now()
+    )
+    invalidate_commented_post(instance.post_id)
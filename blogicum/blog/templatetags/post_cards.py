@@ -0,0 +1,32 @@
+from django import template
+from django.conf import settings
+from django.template.loader import get_template
+
+from blog.caching import fill_cache, get_cache, versioned_key
+from core.instrumentation import record_cache
+
+register = template.Library()
+
+CARD_TEMPLATE = 'includes/post_card.html'
+
+
+def card_cache_key(post):
+    return versioned_key(
+        'card',
+        f'post:{post.id}',
+        f'category:{post.category_id}',
+        f'location:{post.location_id}',
+        f'user:{post.author_id}',
+    )
+
+
+@register.simple_tag
+def post_card(post):
+    cache = get_cache()
+    key = card_cache_key(post)
+    html = cache.get(key)
+    record_cache(html is not None)
+    if html is None:
+        html = get_template(CARD_TEMPLATE).render({'post': post})
+        fill_cache(key, html, settings.POSTS_CARD_CACHE_TIMEOUT)
+    return html
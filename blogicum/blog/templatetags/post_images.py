@@ -0,0 +1,30 @@
+from django import template
+
+from blog.thumbnails import get_thumbnail_urls
+
+register = template.Library()
+
+IMAGE_CLASS = 'border-3 rounded img-fluid img-thumbnail mb-2 mx-auto d-block'
+
+
+def _srcset(urls, image_format):
+    return ', '.join(
+        f'{variant_urls[image_format]} {width}w'
+        for width, variant_urls in urls.values()
+    )
+
+
+@register.inclusion_tag('includes/post_image.html')
+def post_image(post, variant='card', css_class=IMAGE_CLASS):
+    context = {'image': post.image, 'css_class': css_class}
+    urls = get_thumbnail_urls(post)
+    if urls is None or variant not in urls:
+        return context
+    width, variant_urls = urls[variant]
+    context.update(
+        src=variant_urls['jpeg'],
+        srcset=_srcset(urls, 'jpeg'),
+        webp_srcset=_srcset(urls, 'webp') if 'webp' in variant_urls else '',
+        sizes=f'(max-width: {width}px) 100vw, {width}px',
+    )
+    return context
@@ -0,0 +1,113 @@
+import logging
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from .caching import bump_versions
+from .feeds import post_feeds
+from .models import Post
+
+logger = logging.getLogger(__name__)
+
+THUMBNAILS_DIR = 'thumbnails'
+FORMATS = {'jpeg': 'jpg', 'webp': 'webp'}
+
+
+def thumbnail_formats():
+    if settings.POSTS_THUMBNAIL_WEBP:
+        return tuple(FORMATS)
+    return ('jpeg',)
+
+
+def thumbnail_name(image_name, variant, image_format):
+    return posixpath.join(
+        THUMBNAILS_DIR, image_name, f'{variant}.{FORMATS[image_format]}'
+    )
+
+
+def thumbnail_names(image_name):
+    return [
+        thumbnail_name(image_name, variant, image_format)
+        for variant in settings.POSTS_THUMBNAIL_SIZES
+        for image_format in FORMATS
+    ]
+
+
+def _encode(image, image_format):
+    buffer = BytesIO()
+    image.save(
+        buffer,
+        format=image_format.upper(),
+        quality=settings.POSTS_THUMBNAIL_QUALITY,
+        optimize=True,
+        **({'progressive': True} if image_format == 'jpeg' else {}),
+    )
+    return ContentFile(buffer.getvalue())
+
+
+def generate_thumbnails(image):
+    storage = image.storage
+    widths = {}
+    try:
+        with image.open('rb'), Image.open(image) as original:
+            original = ImageOps.exif_transpose(original).convert('RGB')
+            for variant, size in settings.POSTS_THUMBNAIL_SIZES.items():
+                resized = original.copy()
+                resized.thumbnail((size, size), Image.LANCZOS)
+                widths[variant] = resized.width
+                for image_format in thumbnail_formats():
+                    name = thumbnail_name(image.name, variant, image_format)
+                    storage.delete(name)
+                    storage.save(name, _encode(resized, image_format))
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.warning(
+            'Не удалось создать миниатюры для %s', image.name, exc_info=True
+        )
+        return None
+    return widths
+
+
+def generate_post_thumbnails(post_id, image_name):
+    post = Post.objects.filter(pk=post_id, image=image_name).only(
+        'id', 'image', 'category_id', 'author_id'
+    ).first()
+    if post is None:
+        return
+    Post.objects.filter(pk=post_id, image=image_name).update(
+        thumbnails=generate_thumbnails(post.image)
+    )
+    bump_versions(
+        *post_feeds(post.category_id, post.author_id), f'post:{post_id}'
+    )
+
+
+def delete_thumbnails(image_name, storage):
+    for name in thumbnail_names(image_name):
+        storage.delete(name)
+
+
+def delete_posts_thumbnails(image_names):
+    storage = Post._meta.get_field('image').storage
+    for image_name in image_names:
+        delete_thumbnails(image_name, storage)
+
+
+def get_thumbnail_urls(post):
+    if not post.thumbnails:
+        return None
+    storage = post.image.storage
+    return {
+        variant: (
+            width,
+            {
+                image_format: storage.url(
+                    thumbnail_name(post.image.name, variant, image_format)
+                )
+                for image_format in thumbnail_formats()
+            },
+        )
+        for variant, width in post.thumbnails.items()
+    }
@@ -7,6 +7,11 @@ app_name = 'blog'
 
 posts_urls = [
     path('<int:pk>/', views.PostDetailView.as_view(), name='post_detail'),
+    path(
+        '<int:pk>/comments/',
+        views.PostCommentsView.as_view(),
+        name='post_comments',
+    ),
     path('create/', views.PostCreateView.as_view(), name='create_post'),
     path(
         '<int:pk>/edit/',
@@ -37,6 +42,7 @@ posts_urls = [
 
 urlpatterns = [
     path('', views.PostListView.as_view(), name='index'),
+    path('search/', views.PostSearchView.as_view(), name='search'),
     path('posts/', include(posts_urls)),
     path(
         'category/<slug:slug>/',
@@ -1,20 +1,31 @@
+from urllib.parse import urlencode
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404
-from django.shortcuts import get_object_or_404
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404, render
 from django.urls import reverse, reverse_lazy
-from django.utils import timezone
 from django.views.generic import (
     CreateView,
     DeleteView,
     DetailView,
     ListView,
     UpdateView,
+    View,
 )
+from django.views.generic.detail import SingleObjectMixin
 
+from .feeds import category_feed
 from .forms import CommentForm, PostForm
-from .mixins import CommentActionsMixin, PostActionsMixin, PostListMixin
+from .mixins import (
+    CommentActionsMixin,
+    OwnedObjectMixin,
+    PostActionsMixin,
+    PostListMixin,
+    VisiblePostMixin,
+)
 from .models import Category, Post
+from .search import search_posts
 from core.utils import select_posts
 
 UserModel = get_user_model()
@@ -23,62 +34,108 @@ UserModel = get_user_model()
 class PostListView(PostListMixin, ListView):
     template_name = 'blog/index.html'
 
-    def get_queryset(self):
-        filters = {
+    def get_post_filters(self):
+        return {
             'category__is_published': True,
         }
-        return select_posts(**filters)
 
 
 class CategoryPostListView(PostListMixin, ListView):
     template_name = 'blog/category.html'
     category_slug = 'slug'
+    category = None
 
-    def get_queryset(self):
-        filters = {
-            'category__slug': self.kwargs[self.category_slug],
+    def get_category(self):
+        if self.category is None:
+            self.category = get_object_or_404(
+                Category.objects.filter(is_published=True),
+                slug=self.kwargs[self.category_slug],
+            )
+        return self.category
+
+    def get_feed(self):
+        return category_feed(self.get_category().id)
+
+    def get_post_filters(self):
+        return {
+            'category': self.get_category(),
         }
-        return select_posts(**filters)
 
     def get_context_data(self, **kwargs):
-        category = get_object_or_404(
-            Category.objects.filter(is_published=True),
-            slug=self.kwargs[self.category_slug],
+        return super().get_context_data(
+            category=self.get_category(), **kwargs
+        )
+
+
+class PostSearchView(ListView):
+    template_name = 'blog/search.html'
+    paginate_by = 10
+    query_kwarg = 'q'
+    max_query_length = 200
+
+    def get_query(self):
+        query = self.request.GET.get(self.query_kwarg, '')
+        return query.strip()[:self.max_query_length]
+
+    def get_queryset(self):
+        return search_posts(
+            select_posts(category__is_published=True), self.get_query()
+        )
+
+    def get_context_data(self, **kwargs):
+        query = self.get_query()
+        return super().get_context_data(
+            query=query,
+            page_query=f'{urlencode({self.query_kwarg: query})}&',
+            **kwargs,
         )
-        return super().get_context_data(category=category, **kwargs)
 
 
-class PostDetailView(DetailView):
-    model = Post
+class PostDetailView(VisiblePostMixin, DetailView):
     template_name = 'blog/detail.html'
-    post_pk = 'pk'
 
-    def dispatch(self, request, *args, **kwargs):
-        post = get_object_or_404(Post, pk=kwargs[self.post_pk])
-        if (
-            not (
-                post.is_published
-                and post.category.is_published
-                and post.pub_date <= timezone.now()
-            )
-            and request.user != post.author
-        ):
-            raise Http404
-        return super().dispatch(request, *args, **kwargs)
+    def get(self, request, *args, **kwargs):
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
 
     def get_context_data(self, **kwargs):
         return super().get_context_data(
             form=CommentForm(),
-            comments=self.object.comments.select_related('author'),
+            comments=self.get_comments_page(),
             **kwargs,
         )
 
 
+class PostCommentsView(VisiblePostMixin, SingleObjectMixin, View):
+    template_name = 'includes/comment_list.html'
+
+    def get(self, request, *args, **kwargs):
+        comments = self.get_comments_page()
+        if request.GET.get('format') != 'json':
+            return render(
+                request,
+                self.template_name,
+                {'post': self.object, 'comments': comments},
+            )
+        return JsonResponse({
+            'comments': [
+                {
+                    'id': comment.id,
+                    'author': comment.author.username,
+                    'text': comment.text,
+                    'created_at': comment.created_at.isoformat(),
+                }
+                for comment in comments
+            ],
+            'next_cursor': comments.next_cursor,
+        })
+
+
 class PostCreateView(PostActionsMixin, CreateView):
     form_class = PostForm
 
     def dispatch(self, request, *args, **kwargs):
-        return super(PostActionsMixin, self).dispatch(request, *args, **kwargs)
+        return super(OwnedObjectMixin, self).dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
         form.instance.author = self.request.user
@@ -98,28 +155,29 @@ class PostUpdateView(PostActionsMixin, UpdateView):
 
 
 class PostDeleteView(PostActionsMixin, DeleteView):
+    queryset = Post.objects.select_related('location')
     success_url = reverse_lazy('blog:index')
 
     def get_context_data(self, **kwargs):
         return super().get_context_data(
-            form=PostForm(instance=self.get_object()), **kwargs
+            form=PostForm(instance=self.object), **kwargs
         )
 
 
 class CommentCreateView(CommentActionsMixin, LoginRequiredMixin, CreateView):
-    post_obj = None
     form_class = CommentForm
     post_pk = 'pk'
 
     def dispatch(self, request, *args, **kwargs):
-        self.post_obj = get_object_or_404(Post, pk=kwargs[self.post_pk])
-        return super(CommentActionsMixin, self).dispatch(
+        if not Post.objects.filter(pk=kwargs[self.post_pk]).exists():
+            raise Http404
+        return super(OwnedObjectMixin, self).dispatch(
             request, *args, **kwargs
         )
 
     def form_valid(self, form):
         form.instance.author = self.request.user
-        form.instance.post = self.post_obj
+        form.instance.post_id = self.kwargs[self.post_pk]
         return super().form_valid(form)
 
 
@@ -19,16 +19,19 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'debug_toolbar',
     'django_bootstrap5',
+    'core',
     'blog',
     'pages',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ReplicaMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware',
@@ -58,6 +61,30 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+    }
+}
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    # SQLite сам повторяет заблокированные запросы с нарастающей паузой,
+    # пока не истечёт busy_timeout; отдельного механизма повторов нет.
+    'busy_timeout': 5000,
+}
+
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+
+REPLICA_DATABASES = []
+
+REPLICA_PIN_SECONDS = 10
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blogicum',
     }
 }
 
@@ -101,6 +128,12 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static_dev',
 ]
 
+STATIC_ROOT = BASE_DIR / 'static'
+
+STATICFILES_STORAGE = 'core.staticfiles.CompressedManifestStaticFilesStorage'
+
+STATIC_MAX_AGE = 60 * 60
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 CSRF_FAILURE_VIEW = 'pages.views.csrf_failure'
@@ -120,3 +153,83 @@ EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 
 TEMPLATES_DIR = BASE_DIR / 'templates'
+
+POSTS_CURSOR_PAGINATION = False
+
+POSTS_CACHE_ALIAS = 'default'
+
+POSTS_CARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+POSTS_PAGE_CACHE_TIMEOUT = 60 * 5
+
+POSTS_COUNT_TIMEOUT = 60 * 5
+
+POSTS_COUNT_APPROXIMATE_THRESHOLD = 10_000
+
+POSTS_COUNT_APPROXIMATE_TIMEOUT = 60 * 30
+
+# Поток публикации запускается только в процессе веб-сервера (wsgi/asgi).
+# Команда publish_scheduled требует общего для процессов кеша.
+POSTS_SCHEDULER_ENABLED = False
+
+POSTS_SCHEDULER_INTERVAL = 60
+
+POSTS_SCHEDULE_LOOKBACK = 60 * 60
+
+POSTS_THUMBNAIL_SIZES = {'card': 640, 'detail': 1280}
+
+POSTS_THUMBNAIL_QUALITY = 82
+
+POSTS_THUMBNAIL_WEBP = True
+
+POSTS_IMAGE_MAX_PIXELS = 40_000_000
+
+UPLOAD_MAX_FILE_SIZE = 10 * 1024 * 1024
+
+UPLOAD_LIMITED_FIELDS = ('image',)
+
+FILE_UPLOAD_HANDLERS = [
+    'core.uploads.LimitedUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 10_000
+
+ADMIN_COUNT_CACHE_TIMEOUT = 60 * 5
+
+MODERATION_BATCH_SIZE = 1000
+
+MODERATION_BATCH_PAUSE = 0
+
+JOBS_EAGER = False
+
+JOBS_WORKERS = 2
+
+JOBS_BATCH_SIZE = 10
+
+JOBS_POLL_INTERVAL = 1
+
+JOBS_MAX_ATTEMPTS = 3
+
+JOBS_RETRY_DELAY = 30
+
+JOBS_STALE_TIMEOUT = 60 * 10
+
+PROFILING_SAMPLE_RATE = 0.0
+
+PROFILING_BUFFER_SIZE = 200
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'blogicum.profiling': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
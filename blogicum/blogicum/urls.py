@@ -3,6 +3,7 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from core.views import profiling
 from users.views import UsersCreateView
 
 handler404 = 'pages.views.page_not_found'
@@ -10,6 +11,7 @@ handler500 = 'pages.views.internal_server_error'
 
 urlpatterns = [
     path('', include('blog.urls', namespace='blog')),
+    path('admin/profiling/', profiling, name='profiling'),
     path('admin/', admin.site.urls),
     path('auth/', include('django.contrib.auth.urls')),
     path(
@@ -5,3 +5,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
 
 application = get_wsgi_application()
+
+from blog.schedule import start_scheduler  # noqa: E402
+from core.staticfiles import CompressedStaticFiles  # noqa: E402
+
+application = CompressedStaticFiles(application)
+start_scheduler()
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'run_at', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('name',)
+    readonly_fields = ('last_error', 'created_at', 'updated_at')
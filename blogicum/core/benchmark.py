@@ -0,0 +1,59 @@
+import json
+import statistics
+import time
+
+from django.utils import timezone
+
+from .instrumentation import collect_metrics
+
+
+def percentile(values, percent):
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method='inclusive')[
+        percent - 1
+    ]
+
+
+def measure(
+    name, client, url, requests=20, warmup=2, before_request=None
+):
+    for _ in range(warmup):
+        client.get(url)
+    latencies, samples, statuses = [], [], set()
+    for _ in range(requests):
+        if before_request is not None:
+            before_request()
+        with collect_metrics() as metrics:
+            started = time.perf_counter()
+            response = client.get(url)
+            latencies.append((time.perf_counter() - started) * 1000)
+        statuses.add(response.status_code)
+        samples.append(metrics.as_dict())
+    return {
+        'name': name,
+        'url': url,
+        'requests': requests,
+        'status': sorted(statuses),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        **{
+            key: round(statistics.mean(sample[key] for sample in samples), 3)
+            for key in ('queries', 'sql_ms', 'template_ms')
+        },
+    }
+
+
+def dump_results(path, results, **meta):
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump(
+            {
+                'created_at': timezone.now().isoformat(),
+                **meta,
+                'results': results,
+            },
+            output,
+            ensure_ascii=False,
+            indent=2,
+        )
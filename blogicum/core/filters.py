@@ -0,0 +1,50 @@
+from django.contrib import admin
+
+
+class InputFilter(admin.SimpleListFilter):
+    template = 'admin/input_filter.html'
+
+    def lookups(self, request, model_admin):
+        return ((None, None),)
+
+    def choices(self, changelist):
+        all_choice = next(super().choices(changelist))
+        all_choice['query_parts'] = [
+            (key, value)
+            for key, value in changelist.get_filters_params().items()
+            if key != self.parameter_name
+        ]
+        yield all_choice
+
+    def filter_value(self, value):
+        return value
+
+    def get_filter(self, value):
+        return {self.parameter_name: value}
+
+    def queryset(self, request, queryset):
+        if self.value() is None:
+            return queryset
+        value = self.filter_value(self.value().strip())
+        if value is None:
+            return queryset.none()
+        return queryset.filter(**self.get_filter(value))
+
+
+class RelatedIdFilter(InputFilter):
+    field_name = None
+
+    def filter_value(self, value):
+        return int(value) if value.isdigit() else None
+
+    def get_filter(self, value):
+        return {f'{self.field_name}_id': value}
+
+
+class UsernameFilter(InputFilter):
+    title = 'автор (логин)'
+    parameter_name = 'author'
+    field_name = 'author'
+
+    def get_filter(self, value):
+        return {f'{self.field_name}__username': value}
@@ -0,0 +1,132 @@
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.db import connections
+from django.template.base import Template
+
+_PROJECT_DIR = str(Path(__file__).resolve().parent.parent)
+_WRAPPER_FILES = (__file__, str(Path(__file__).with_name('sqlite.py')))
+_current_metrics = ContextVar('current_metrics', default=None)
+_template_render = Template.render
+
+
+class Metrics:
+    def __init__(self, capture_origin=False, parent=None):
+        self.capture_origin = capture_origin
+        self.parent = parent
+        self.queries = []
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._template_depth = 0
+
+    @property
+    def query_count(self):
+        return len(self.queries)
+
+    def as_dict(self):
+        return {
+            'queries': self.query_count,
+            'sql_ms': round(self.sql_time * 1000, 3),
+            'template_ms': round(self.template_time * 1000, 3),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+
+def _active_metrics():
+    metrics = _current_metrics.get()
+    while metrics is not None:
+        yield metrics
+        metrics = metrics.parent
+
+
+def _timed_render(template, context):
+    outermost = [
+        metrics for metrics in _active_metrics()
+        if not metrics._template_depth
+    ]
+    if not outermost:
+        return _template_render(template, context)
+    for metrics in outermost:
+        metrics._template_depth += 1
+    started = time.perf_counter()
+    try:
+        return _template_render(template, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        for metrics in outermost:
+            metrics.template_time += elapsed
+            metrics._template_depth -= 1
+
+
+def _timed_execute(execute, sql, params, many, context):
+    active = list(_active_metrics())
+    if not active:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        query = {'sql': sql, 'time': elapsed}
+        if any(metrics.capture_origin for metrics in active):
+            query.update(query_origin())
+        for metrics in active:
+            metrics.sql_time += elapsed
+            metrics.queries.append(query)
+
+
+def query_origin():
+    origin = {'template': None, 'source': None}
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        if origin['template'] is None and code.co_name == 'render_annotated':
+            node = frame.f_locals.get('self')
+            token = getattr(node, 'token', None)
+            template = getattr(node, 'origin', None)
+            if token is not None and template is not None:
+                origin['template'] = (
+                    f'{template.template_name}:{token.lineno}'
+                )
+        filename = code.co_filename
+        if (
+            origin['source'] is None
+            and filename.startswith(_PROJECT_DIR)
+            and filename not in _WRAPPER_FILES
+        ):
+            source = Path(filename).relative_to(_PROJECT_DIR)
+            origin['source'] = f'{source}:{frame.f_lineno}'
+        frame = frame.f_back
+    return origin
+
+
+def record_cache(hit):
+    for metrics in _active_metrics():
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+
+@contextmanager
+def collect_metrics(capture_origin=False):
+    Template.render = _timed_render
+    parent = _current_metrics.get()
+    metrics = Metrics(capture_origin, parent)
+    token = _current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            if parent is None:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(_timed_execute)
+                    )
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
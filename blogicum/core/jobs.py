@@ -0,0 +1,115 @@
+import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+
+def job_name(func):
+    if isinstance(func, str):
+        return func
+    return f'{func.__module__}.{func.__qualname__}'
+
+
+def enqueue(func, *args, delay=0, max_attempts=None, **kwargs):
+    job = Job(
+        name=job_name(func),
+        args=list(args),
+        kwargs=kwargs,
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+    if settings.JOBS_EAGER:
+        import_string(job.name)(*job.args, **job.kwargs)
+        return job
+    job.save()
+    return job
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=settings.JOBS_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_jobs(limit):
+    now = timezone.now()
+    candidates = Job.objects.filter(
+        status=Job.PENDING, run_at__lte=now
+    ).values_list('pk', flat=True)[:limit]
+    claimed = []
+    for pk in candidates:
+        if Job.objects.filter(pk=pk, status=Job.PENDING).update(
+            status=Job.RUNNING, updated_at=now
+        ):
+            claimed.append(pk)
+    return list(Job.objects.filter(pk__in=claimed))
+
+
+def requeue_stale_jobs():
+    stale_since = timezone.now() - timedelta(
+        seconds=settings.JOBS_STALE_TIMEOUT
+    )
+    return Job.objects.filter(
+        status=Job.RUNNING, updated_at__lt=stale_since
+    ).update(status=Job.PENDING)
+
+
+def run_job(job):
+    attempts = job.attempts + 1
+    try:
+        import_string(job.name)(*job.args, **job.kwargs)
+    except Exception:
+        logger.exception('Фоновая задача %s завершилась ошибкой', job)
+        failed = attempts >= job.max_attempts
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.FAILED if failed else Job.PENDING,
+            attempts=attempts,
+            run_at=timezone.now() + retry_delay(attempts),
+            last_error=traceback.format_exc(),
+            updated_at=timezone.now(),
+        )
+        return False
+    finally:
+        close_old_connections()
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.DONE, attempts=attempts, updated_at=timezone.now()
+    )
+    return True
+
+
+def run_pending_jobs(executor=None, limit=None):
+    jobs = claim_jobs(limit or settings.JOBS_BATCH_SIZE)
+    if executor is None:
+        return [run_job(job) for job in jobs]
+    return list(executor.map(run_job, jobs))
+
+
+class Worker:
+    def __init__(self, workers, interval):
+        self.workers = workers
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        requeue_stale_jobs()
+        with ThreadPoolExecutor(
+            self.workers, thread_name_prefix='job-worker'
+        ) as executor:
+            while not self._stopped.is_set():
+                processed = run_pending_jobs(
+                    executor, limit=self.workers * settings.JOBS_BATCH_SIZE
+                )
+                close_old_connections()
+                if not processed:
+                    self._stopped.wait(self.interval)
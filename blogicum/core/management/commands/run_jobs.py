@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.jobs import Worker, requeue_stale_jobs, run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = 'Выполняет фоновые задачи из очереди в базе данных.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Выполнить готовые задачи и завершиться.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.JOBS_WORKERS,
+            help='Количество потоков-исполнителей.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help='Пауза между опросами пустой очереди, в секундах.',
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            requeue_stale_jobs()
+            results = run_pending_jobs()
+            self.stdout.write(
+                f'Выполнено задач: {sum(results)}, '
+                f'с ошибкой: {len(results) - sum(results)}'
+            )
+            return
+        try:
+            Worker(options['workers'], options['interval']).run()
+        except KeyboardInterrupt:
+            pass
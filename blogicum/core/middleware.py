@@ -0,0 +1,79 @@
+import json
+import logging
+import random
+import time
+from collections import deque
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+
+from .instrumentation import collect_metrics
+from .routers import track_reads
+
+logger = logging.getLogger('blogicum.profiling')
+
+SAFE_METHODS = ('GET', 'HEAD')
+REPLICA_APPS = ('blog', 'users')
+PRIMARY_PIN_COOKIE = 'primary_pin'
+
+
+@lru_cache(maxsize=None)
+def get_profiles():
+    return deque(maxlen=settings.PROFILING_BUFFER_SIZE)
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        if not self.sample_rate:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+        started = time.perf_counter()
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        profile = {
+            'timestamp': timezone.now().isoformat(),
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round((time.perf_counter() - started) * 1000, 3),
+            **metrics.as_dict(),
+        }
+        get_profiles().append(profile)
+        logger.info(json.dumps(profile))
+        return response
+
+
+class ReplicaMiddleware:
+    def __init__(self, get_response):
+        if not settings.REPLICA_DATABASES:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with track_reads() as reads:
+            request.replica_reads = reads
+            response = self.get_response(request)
+        if request.method not in SAFE_METHODS or reads.wrote:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if (
+            request.method in SAFE_METHODS
+            and PRIMARY_PIN_COOKIE not in request.COOKIES
+            and view_func.__module__.split('.')[0] in REPLICA_APPS
+        ):
+            request.replica_reads.use_replica()
@@ -0,0 +1,184 @@
+import base64
+import binascii
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .utils import estimate_count
+
+NEXT = 'n'
+PREVIOUS = 'p'
+CURSOR_SEPARATOR = '|'
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class CountedPaginator(Paginator):
+    def __init__(self, *args, count_func=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_func = count_func
+
+    @cached_property
+    def count(self):
+        if self.count_func is None:
+            return super().count
+        return self.count_func()
+
+
+def cached_count(queryset):
+    sql, params = queryset.query.sql_with_params()
+    key = 'count:' + hashlib.md5(f'{sql}|{params}'.encode()).hexdigest()
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, settings.ADMIN_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        threshold = settings.ADMIN_ESTIMATED_COUNT_THRESHOLD
+        queryset = self.object_list.order_by()
+        count = queryset[:threshold + 1].count()
+        if count <= threshold:
+            return count
+        estimate = estimate_count(queryset)
+        if estimate is None:
+            estimate = cached_count(queryset)
+        return max(count, estimate)
+
+
+class CursorPage:
+    cursor_based = True
+    number = None
+
+    def __init__(
+        self, object_list, paginator, next_cursor=None, previous_cursor=None
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<Cursor page of {len(self)} objects>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    def __init__(self, object_list, per_page, ordering=('-pub_date', '-id')):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.fields = [
+            object_list.model._meta.get_field(name.lstrip('-'))
+            for name in self.ordering
+        ]
+
+    def encode_cursor(self, direction, obj):
+        values = (field.value_to_string(obj) for field in self.fields)
+        raw = CURSOR_SEPARATOR.join((direction, *values))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(
+                cursor + '=' * (-len(cursor) % 4)
+            ).decode()
+            direction, *values = raw.split(CURSOR_SEPARATOR)
+            if direction not in (NEXT, PREVIOUS):
+                raise ValueError
+            if len(values) != len(self.fields):
+                raise ValueError
+            return direction, [
+                field.to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (
+            binascii.Error, UnicodeDecodeError, ValueError, ValidationError
+        ):
+            raise InvalidCursor('Некорректный курсор страницы.')
+
+    def _keyset_filter(self, values, backwards):
+        condition = Q()
+        for position, name in enumerate(self.ordering):
+            descending = name.startswith('-')
+            lookup = 'lt' if descending != backwards else 'gt'
+            equal = {
+                field.name: value
+                for field, value in zip(
+                    self.fields[:position], values[:position]
+                )
+            }
+            condition |= Q(
+                **equal,
+                **{f'{name.lstrip("-")}__{lookup}': values[position]},
+            )
+        return condition
+
+    def _reversed_ordering(self):
+        return [
+            name[1:] if name.startswith('-') else f'-{name}'
+            for name in self.ordering
+        ]
+
+    def page(self, cursor=None):
+        if not cursor:
+            direction, values = NEXT, None
+        else:
+            direction, values = self.decode_cursor(cursor)
+        backwards = direction == PREVIOUS
+        queryset = self.object_list.order_by(*self.ordering)
+        if values is not None:
+            queryset = queryset.filter(
+                self._keyset_filter(values, backwards)
+            )
+        if backwards:
+            queryset = queryset.order_by(*self._reversed_ordering())
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            if not has_more:
+                return self.page()
+            rows.reverse()
+        if not rows:
+            return CursorPage(rows, self)
+        has_next = has_more if not backwards else True
+        has_previous = values is not None
+        return CursorPage(
+            rows,
+            self,
+            next_cursor=(
+                self.encode_cursor(NEXT, rows[-1]) if has_next else None
+            ),
+            previous_cursor=(
+                self.encode_cursor(PREVIOUS, rows[0])
+                if has_previous else None
+            ),
+        )
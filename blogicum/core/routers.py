@@ -0,0 +1,63 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+_reads = ContextVar('replica_reads', default=None)
+
+
+class ReplicaReads:
+    def __init__(self):
+        self.alias = None
+        self.wrote = False
+
+    def use_replica(self):
+        self.alias = random.choice(settings.REPLICA_DATABASES)
+
+
+@contextmanager
+def track_reads():
+    reads = ReplicaReads()
+    token = _reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _reads.reset(token)
+
+
+def reading_replica():
+    reads = _reads.get()
+    return reads is not None and reads.alias is not None and not reads.wrote
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        reads = _reads.get()
+        if reads is None or reads.wrote:
+            return None
+        return reads.alias
+
+    def db_for_write(self, model, **hints):
+        reads = _reads.get()
+        if reads is not None:
+            reads.wrote = True
+        instance = hints.get('instance')
+        if (
+            instance is not None
+            and instance._state.db in settings.REPLICA_DATABASES
+        ):
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        if db in settings.REPLICA_DATABASES:
+            return False
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *settings.REPLICA_DATABASES}
+        if {obj1._state.db, obj2._state.db} <= aliases:
+            return True
+        return None
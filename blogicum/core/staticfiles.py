@@ -0,0 +1,150 @@
+import gzip
+import mimetypes
+import os
+import posixpath
+from email.utils import formatdate
+from wsgiref.util import FileWrapper
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import (
+    ManifestStaticFilesStorage,
+    staticfiles_storage,
+)
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    '.css', '.js', '.svg', '.ico', '.json', '.map', '.txt', '.xml', '.html',
+)
+MIN_COMPRESS_SIZE = 256
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def _gzip(content):
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def _brotli(content):
+    return brotli.compress(content, quality=11)
+
+
+def get_compressors():
+    compressors = {'br': ('.br', _brotli)} if brotli is not None else {}
+    compressors['gzip'] = ('.gz', _gzip)
+    return compressors
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    manifest_strict = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        names = set(paths) | set(self.hashed_files.values())
+        for name in sorted(names):
+            for compressed_name in self.compress(name):
+                yield name, compressed_name, True
+
+    def compress(self, name):
+        if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+            return
+        if not self.exists(name):
+            return
+        with self.open(name) as original:
+            content = original.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return
+        for suffix, compress in get_compressors().values():
+            compressed = compress(content)
+            if len(compressed) >= len(content):
+                continue
+            compressed_name = name + suffix
+            self.delete(compressed_name)
+            self._save(compressed_name, ContentFile(compressed))
+            yield compressed_name
+
+
+def accepted_encodings(header):
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class CompressedStaticFiles:
+    def __init__(self, application, root=None, prefix=None):
+        self.application = application
+        self.root = os.fspath(root or settings.STATIC_ROOT or '')
+        self.prefix = prefix or settings.STATIC_URL
+
+    def is_immutable(self, name):
+        hashed_files = getattr(staticfiles_storage, 'hashed_files', {})
+        return name in hashed_files.values()
+
+    def find_file(self, name):
+        name = posixpath.normpath(name).lstrip('/')
+        if not self.root or name.startswith('..'):
+            return None, None
+        path = os.path.join(self.root, *name.split('/'))
+        if not os.path.isfile(path):
+            return None, None
+        return name, path
+
+    def choose_encoding(self, path, environ):
+        accepted = accepted_encodings(environ.get('HTTP_ACCEPT_ENCODING', ''))
+        for encoding, (suffix, _) in get_compressors().items():
+            if encoding in accepted and os.path.isfile(path + suffix):
+                return encoding, path + suffix
+        return None, path
+
+    def __call__(self, environ, start_response):
+        path_info = environ.get('PATH_INFO', '')
+        if (
+            not path_info.startswith(self.prefix)
+            or environ.get('REQUEST_METHOD') not in ('GET', 'HEAD')
+        ):
+            return self.application(environ, start_response)
+        name, path = self.find_file(path_info[len(self.prefix):])
+        if path is None:
+            return self.application(environ, start_response)
+        encoding, served_path = self.choose_encoding(path, environ)
+        content_type, _ = mimetypes.guess_type(name)
+        stat = os.stat(served_path)
+        headers = [
+            ('Content-Type', content_type or 'application/octet-stream'),
+            ('Content-Length', str(stat.st_size)),
+            ('Last-Modified', formatdate(stat.st_mtime, usegmt=True)),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if encoding:
+            headers.append(('Content-Encoding', encoding))
+        if self.is_immutable(name):
+            headers.append(('Cache-Control', IMMUTABLE_CACHE_CONTROL))
+        else:
+            headers.append(
+                ('Cache-Control', f'public, max-age={settings.STATIC_MAX_AGE}')
+            )
+        start_response('200 OK', headers)
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            return []
+        file_wrapper = environ.get('wsgi.file_wrapper', FileWrapper)
+        return file_wrapper(open(served_path, 'rb'))
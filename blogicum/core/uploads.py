@@ -0,0 +1,88 @@
+from io import BytesIO
+
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.template.defaultfilters import filesizeformat
+from PIL import Image
+
+
+class OversizedUpload(UploadedFile):
+    def __init__(self, name, content_type, size, charset):
+        super().__init__(BytesIO(), name, content_type, size, charset)
+
+
+class LimitedUploadHandler(FileUploadHandler):
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        self.limited = field_name in settings.UPLOAD_LIMITED_FIELDS
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.limited:
+            return raw_data
+        self.received += len(raw_data)
+        if self.received > settings.UPLOAD_MAX_FILE_SIZE:
+            return None
+        return raw_data
+
+    def file_complete(self, file_size):
+        if not self.limited or file_size <= settings.UPLOAD_MAX_FILE_SIZE:
+            return None
+        return OversizedUpload(
+            self.file_name, self.content_type, file_size, self.charset
+        )
+
+
+class LimitedImageField(forms.ImageField):
+    default_error_messages = {
+        'file_too_large': (
+            'Файл слишком большой: %(size)s, допускается не более %(limit)s.'
+        ),
+        'too_many_pixels': (
+            'Изображение слишком большое: допускается не более'
+            ' %(limit)s пикселей.'
+        ),
+    }
+
+    def to_python(self, data):
+        if data in self.empty_values:
+            return None
+        limit = settings.UPLOAD_MAX_FILE_SIZE
+        if data.size > limit:
+            raise ValidationError(
+                self.error_messages['file_too_large'],
+                code='file_too_large',
+                params={
+                    'size': filesizeformat(data.size),
+                    'limit': filesizeformat(limit),
+                },
+            )
+        self.check_dimensions(data)
+        return super().to_python(data)
+
+    def check_dimensions(self, data):
+        if hasattr(data, 'temporary_file_path'):
+            source = data.temporary_file_path()
+        else:
+            source = data
+        limit = settings.POSTS_IMAGE_MAX_PIXELS
+        error = ValidationError(
+            self.error_messages['too_many_pixels'],
+            code='too_many_pixels',
+            params={'limit': limit},
+        )
+        try:
+            with Image.open(source) as image:
+                width, height = image.size
+        except Image.DecompressionBombError:
+            raise error
+        except Exception:
+            return
+        finally:
+            if hasattr(data, 'seek') and callable(data.seek):
+                data.seek(0)
+        if width * height > limit:
+            raise error
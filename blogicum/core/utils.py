@@ -1,17 +1,72 @@
-from django.db.models import Count
+from django.db import OperationalError, connections
+from django.db.models.functions import Substr
 from django.utils import timezone
 
+from blog.constants import POST_PREVIEW_LENGTH
 from blog.models import Post
 
+CARD_FIELDS = (
+    'id',
+    'title',
+    'image',
+    'thumbnails',
+    'pub_date',
+    'is_published',
+    'comment_count',
+    'author__username',
+    'category__title',
+    'category__slug',
+    'category__is_published',
+    'location__name',
+    'location__is_published',
+)
 
-def select_posts(only_published=True, **filters):
+
+def filter_posts(only_published=True, **filters):
     published_filters = {'pub_date__lte': timezone.now(), 'is_published': True}
     if not only_published:
         published_filters = {}
-    return (
-        Post.objects.select_related('category', 'author')
-        .prefetch_related('location')
-        .filter(**published_filters, **filters)
-        .annotate(comment_count=Count('comments'))
-        .order_by('-pub_date')
+    return Post.objects.filter(**published_filters, **filters)
+
+
+def select_posts(only_published=True, projection='card', **filters):
+    queryset = (
+        filter_posts(only_published, **filters)
+        .select_related('category', 'location', 'author')
+        .order_by('-pub_date', '-id')
     )
+    if projection == 'card':
+        queryset = queryset.annotate(
+            text_preview=Substr('text', 1, POST_PREVIEW_LENGTH)
+        ).only(*CARD_FIELDS)
+    elif projection != 'full':
+        raise ValueError(f'Unknown post projection: {projection}')
+    return queryset
+
+
+def sqlite_row_estimate(queryset, connection):
+    if queryset.query.where:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT stat FROM sqlite_stat1 WHERE tbl = %s',
+                [queryset.model._meta.db_table],
+            )
+            rows = [int(stat.split()[0]) for stat, in cursor.fetchall()]
+    except OperationalError:
+        return None
+    return max(rows, default=None)
+
+
+def estimate_count(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor == 'sqlite':
+        return sqlite_row_estimate(queryset, connection)
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]['Plan']['Plan Rows'])
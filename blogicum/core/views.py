@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+from .middleware import get_profiles
+
+
+@staff_member_required
+def profiling(request):
+    return JsonResponse(
+        {
+            'sample_rate': settings.PROFILING_SAMPLE_RATE,
+            'requests': list(reversed(get_profiles())),
+        },
+        json_dumps_params={'ensure_ascii': False},
+    )
@@ -5,7 +5,8 @@ from django.views.generic import CreateView, DetailView, UpdateView
 from django.views.generic.list import MultipleObjectMixin
 
 from .forms import MyUserCreationForm
-from core.utils import select_posts
+from blog.feeds import author_feed
+from blog.mixins import PostFeedMixin
 
 UserModel = get_user_model()
 
@@ -17,25 +18,41 @@ class UsersCreateView(CreateView):
     success_url = reverse_lazy('blog:index')
 
 
-class ProfileDetailView(DetailView, MultipleObjectMixin):
+class ProfileDetailView(PostFeedMixin, DetailView, MultipleObjectMixin):
     model = UserModel
     template_name = 'blog/profile.html'
     slug_field = 'username'
     context_object_name = 'profile'
-    paginate_by = 10
     profile_slug = 'slug'
+    object = None
 
-    def get_context_data(self, **kwargs):
+    def get_object(self, queryset=None):
+        if self.object is None:
+            self.object = super().get_object(queryset)
+        return self.object
+
+    def only_published(self):
+        return self.kwargs[self.profile_slug] != self.request.user.username
+
+    def get_feed(self):
+        return author_feed(
+            self.get_object().id, with_drafts=not self.only_published()
+        )
+
+    def get_version_names(self):
+        return [*super().get_version_names(), f'user:{self.get_object().id}']
+
+    def get_post_filters(self):
         filters = {
             'author': self.get_object(),
         }
-        if self.kwargs[self.profile_slug] != self.request.user.username:
+        if self.only_published():
             filters['category__is_published'] = True
-            only_published = True
-        else:
-            only_published = False
+        return filters
+
+    def get_context_data(self, **kwargs):
         return super().get_context_data(
-            object_list=select_posts(only_published, **filters), **kwargs
+            object_list=self.get_posts(), **kwargs
         )
 
 
@@ -19,6 +19,7 @@ from typing import (
 import pytest
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.db.models import Model, Field
 from django.forms import BaseForm
 from django.http import HttpResponse
@@ -35,12 +36,63 @@ UrlRepr = NamedTuple("UrlRepr", [("url", str), ("repr", str)])
 TitledUrlRepr = TypeVar("TitledUrlRepr", bound=Tuple[UrlRepr, str])
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true",
+        help="Run request-level benchmarks marked with `benchmark`.",
+    )
+    parser.addoption(
+        "--benchmark-json", default=None,
+        help="Write benchmark results to this JSON file.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="use --benchmark to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+        django_db_modify_db_settings_parallel_suffix, tmp_path_factory
+):
+    from django.conf import settings
+
+    directory = tmp_path_factory.mktemp("databases")
+    primary = settings.DATABASES["default"]
+    primary["TEST"] = {
+        **primary["TEST"], "NAME": str(directory / "primary.sqlite3")
+    }
+    settings.DATABASES["replica"] = {
+        **primary,
+        "TEST": {
+            **primary["TEST"], "NAME": str(directory / "replica.sqlite3")
+        },
+    }
+
+
 @pytest.fixture(autouse=True)
 def enable_debug_false():
     with override_settings(DEBUG=False):
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    return settings.MEDIA_ROOT
+
+
 class SafeImportFromContextManager:
     def __init__(
             self,
@@ -92,6 +144,7 @@ pytest_plugins = [
     "fixtures.locations",
     "fixtures.categories",
     "fixtures.comments",
+    "fixtures.queries",
     "adapters.comment",
 ]
 
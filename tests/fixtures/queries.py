@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+
+import pytest
+
+from core.instrumentation import collect_metrics
+
+
+def format_queries(queries):
+    lines = []
+    for number, query in enumerate(queries, start=1):
+        lines.append(f"{number}. {query['sql']}")
+        if query.get("template"):
+            lines.append(f"   шаблон: {query['template']}")
+        if query.get("source"):
+            lines.append(f"   код: {query['source']}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def assert_max_queries(limit, label=""):
+    with collect_metrics(capture_origin=True) as metrics:
+        yield metrics
+    executed = len(metrics.queries)
+    if executed > limit:
+        target = f" для `{label}`" if label else ""
+        pytest.fail(
+            f"Превышен бюджет запросов к базе данных{target}: "
+            f"выполнено {executed}, допустимо не более {limit}.\n"
+            f"{format_queries(metrics.queries)}",
+            pytrace=False,
+        )
+
+
+@pytest.fixture(name="assert_max_queries")
+def assert_max_queries_fixture():
+    return assert_max_queries
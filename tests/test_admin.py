@@ -0,0 +1,119 @@
+import pytest
+from django.db import connection
+
+from blog.admin import PostAdmin
+from blog.models import Post
+from core.filters import InputFilter
+from core.paginators import EstimatedCountPaginator
+
+pytestmark = [pytest.mark.django_db]
+
+POSTS_URL = "/admin/blog/post/"
+COMMENTS_URL = "/admin/blog/comment/"
+
+
+def _changelist_queries(client, url, django_assert_max_num_queries, **data):
+    with django_assert_max_num_queries(10) as captured:
+        response = client.get(url, data)
+    assert response.status_code == 200
+    return len(captured), response
+
+
+def test_post_changelist_queries_do_not_grow(
+        mixer, admin_client, django_assert_max_num_queries
+):
+    mixer.cycle(2).blend("blog.Post")
+    few, _ = _changelist_queries(
+        admin_client, POSTS_URL, django_assert_max_num_queries
+    )
+    mixer.cycle(20).blend("blog.Post")
+    many, response = _changelist_queries(
+        admin_client, POSTS_URL, django_assert_max_num_queries
+    )
+    assert many == few
+    assert response.context["cl"].result_count == 22
+
+
+def test_comment_changelist_queries_do_not_grow(
+        mixer, admin_client, django_assert_max_num_queries
+):
+    mixer.cycle(2).blend("blog.Comment")
+    few, _ = _changelist_queries(
+        admin_client, COMMENTS_URL, django_assert_max_num_queries
+    )
+    mixer.cycle(20).blend("blog.Comment")
+    many, _ = _changelist_queries(
+        admin_client, COMMENTS_URL, django_assert_max_num_queries
+    )
+    assert many == few
+
+
+def test_comment_filters_by_post_id_and_author(mixer, admin_client, user):
+    post = mixer.blend("blog.Post")
+    own = mixer.blend("blog.Comment", post=post, author=user)
+    mixer.blend("blog.Comment", post=post)
+    mixer.cycle(3).blend("blog.Comment")
+
+    response = admin_client.get(COMMENTS_URL, {"post": post.id})
+    assert response.context["cl"].result_count == 2
+    assert 'name="post"' in response.content.decode()
+
+    response = admin_client.get(
+        COMMENTS_URL, {"post": post.id, "author": user.username}
+    )
+    assert list(response.context["cl"].result_list) == [own]
+
+    response = admin_client.get(COMMENTS_URL, {"post": "abc"})
+    assert response.context["cl"].result_count == 0
+
+
+def test_post_form_uses_lightweight_widgets(admin_client):
+    content = admin_client.get(f"{POSTS_URL}add/").content.decode()
+    assert "admin-autocomplete" in content
+    content = admin_client.get(f"{COMMENTS_URL}add/").content.decode()
+    assert "vForeignKeyRawIdAdminField" in content
+
+
+def test_estimated_count_above_threshold(
+        settings, mixer, django_assert_num_queries
+):
+    posts = mixer.cycle(5).blend("blog.Post")
+    posts[1].delete()
+    queryset = Post.objects.all()
+
+    settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 10
+    assert EstimatedCountPaginator(queryset, 2).count == 4
+
+    settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 2
+    with django_assert_num_queries(3):
+        assert EstimatedCountPaginator(queryset, 2).count == 4
+    with django_assert_num_queries(2):
+        assert EstimatedCountPaginator(queryset, 2).count == 4
+
+
+def test_estimated_count_uses_sqlite_statistics(
+        settings, mixer, django_assert_num_queries
+):
+    mixer.cycle(5).blend("blog.Post")
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    Post.objects.filter(pk=Post.objects.first().pk).delete()
+    settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 2
+    with django_assert_num_queries(2) as captured:
+        count = EstimatedCountPaginator(Post.objects.all(), 2).count
+    assert count == 5
+    assert "sqlite_stat1" in captured.captured_queries[-1]["sql"]
+
+
+def test_input_filter_filters_by_parameter(mixer, rf):
+    class TitleFilter(InputFilter):
+        title = "заголовок"
+        parameter_name = "title"
+
+    post = mixer.blend("blog.Post", title="Искомый")
+    mixer.blend("blog.Post", title="Другой")
+    request = rf.get("/", {"title": " Искомый "})
+    list_filter = TitleFilter(
+        request, {"title": " Искомый "}, Post, PostAdmin
+    )
+    assert list(list_filter.queryset(request, Post.objects.all())) == [post]
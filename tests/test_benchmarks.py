@@ -0,0 +1,40 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from blog.benchmarks import run_benchmarks, run_sqlite_workload
+from blog.models import Comment
+from core.benchmark import dump_results
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+
+def test_blog_urls_benchmark(request, tmp_path):
+    call_command(
+        "seed_blog", users=20, categories=3, locations=5, posts=500,
+        comments=2000, stdout=StringIO(),
+    )
+    results = run_benchmarks(requests=10, warmup=1)
+    output = request.config.getoption("--benchmark-json")
+    dump_results(output or tmp_path / "benchmark.json", results, requests=10)
+    for result in results:
+        assert result["status"] == [200], result["name"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sqlite_workload_benchmark(request, tmp_path):
+    call_command(
+        "seed_blog", users=5, categories=2, locations=2, posts=200,
+        comments=200, stdout=StringIO(),
+    )
+    results = run_sqlite_workload(duration=1, readers=2, writers=2)
+    output = request.config.getoption("--benchmark-json")
+    dump_results(output or tmp_path / "sqlite.json", results, duration=1)
+    assert [result["journal_mode"] for result in results] == [
+        "delete", "wal"
+    ]
+    for result in results:
+        assert result["reads_per_s"] > 0, result["name"]
+        assert result["writes_per_s"] > 0, result["name"]
+    assert Comment.objects.count() == 200
@@ -0,0 +1,56 @@
+import pytest
+from django.core.management import call_command
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _comment_count(post):
+    return Post.objects.values_list("comment_count", flat=True).get(
+        pk=post.pk
+    )
+
+
+def test_comment_views_maintain_counter(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    for text in ("first", "second"):
+        user_client.post(f"/posts/{post.id}/comment/", data={"text": text})
+    assert _comment_count(post) == 2
+
+    comment = Comment.objects.filter(post=post).first()
+    user_client.post(f"/posts/{post.id}/delete_comment/{comment.id}/")
+    assert _comment_count(post) == 1
+
+
+def test_cascade_delete_maintains_counter(
+        mixer, another_user, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(2).blend("blog.Comment", post=post, author=another_user)
+    mixer.blend("blog.Comment", post=post)
+    assert _comment_count(post) == 3
+    another_user.delete()
+    assert _comment_count(post) == 1
+
+
+def test_recount_comments_command(mixer, post_with_published_location):
+    post = post_with_published_location
+    mixer.cycle(3).blend("blog.Comment", post=post)
+    Post.objects.update(comment_count=0)
+    call_command("recount_comments")
+    assert _comment_count(post) == 3
+
+
+def test_fixture_round_trip_keeps_counter(
+        mixer, tmp_path, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    fixture = tmp_path / "blog.json"
+    call_command("dumpdata", "blog", "auth.user", output=str(fixture))
+    Post.objects.all().delete()
+    call_command("loaddata", str(fixture), verbosity=0)
+    assert _comment_count(post) == 2
@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def many_comments(mixer, post_with_published_location):
+    return mixer.cycle(25).blend(
+        "blog.Comment", post=post_with_published_location
+    )
+
+
+def test_detail_shows_first_comment_page(
+        unlogged_client, post_with_published_location, many_comments
+):
+    response = unlogged_client.get(
+        f"/posts/{post_with_published_location.id}/"
+    )
+    comments = response.context["comments"]
+    assert [comment.id for comment in comments] == [
+        comment.id for comment in many_comments[:20]
+    ]
+    assert comments.has_next()
+    assert "data-comments-more" in response.content.decode()
+
+
+def test_comment_fragment_returns_next_batch(
+        unlogged_client, post_with_published_location, many_comments
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    cursor = unlogged_client.get(url).context["comments"].next_cursor
+
+    fragment = unlogged_client.get(f"{url}comments/?comments={cursor}")
+    assert fragment.status_code == HTTPStatus.OK
+    content = fragment.content.decode()
+    assert "<html" not in content
+    for comment in many_comments[20:]:
+        assert f'name="comment_{comment.id}"' in content
+
+    data = unlogged_client.get(
+        f"{url}comments/?comments={cursor}&format=json"
+    ).json()
+    assert [item["id"] for item in data["comments"]] == [
+        comment.id for comment in many_comments[20:]
+    ]
+    assert data["next_cursor"] is None
+
+
+def test_comment_fragment_respects_visibility(
+        unlogged_client, mixer, user
+):
+    post = mixer.blend("blog.Post", author=user, is_published=False)
+    response = unlogged_client.get(f"/posts/{post.id}/comments/")
+    assert response.status_code == HTTPStatus.NOT_FOUND
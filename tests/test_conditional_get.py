@@ -0,0 +1,132 @@
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+FIXTURE = Path(__file__).resolve().parent.parent / "db.json"
+
+
+def test_post_detail_revalidates(
+        mixer, django_assert_max_num_queries, post_with_published_location
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    client = Client()
+    response = client.get(url)
+    etag = response["ETag"]
+    assert "Last-Modified" not in response
+    assert "no-cache" in response["Cache-Control"]
+
+    with django_assert_max_num_queries(1):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert not response.templates
+    assert response["ETag"] == etag
+
+    comment = mixer.blend("blog.Comment", post=post)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    etag = response["ETag"]
+
+    comment.text = "Исправленный комментарий"
+    comment.save()
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_post_detail_etag_depends_on_user(
+        user_client, another_user_client, post_with_published_location
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    etag = user_client.get(url)["ETag"]
+    response = another_user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_feed_revalidates_without_queries(
+        mixer, django_assert_num_queries, user, post_with_published_location
+):
+    client = Client()
+    response = client.get("/")
+    etag = response["ETag"]
+    assert "Last-Modified" not in response
+    with django_assert_num_queries(0):
+        response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    response = client.get("/?page=2", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code != HTTPStatus.NOT_MODIFIED
+
+    mixer.blend(
+        "blog.Post",
+        author=user,
+        category=post_with_published_location.category,
+    )
+    response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_post_detail_etag_follows_related_objects(
+        post_with_published_location
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    client = Client()
+    for obj, field, value in (
+        (post.category, "title", "Переименовано"),
+        (post.location, "name", "Переименовано"),
+        (post.author, "username", "renamed"),
+    ):
+        etag = client.get(url)["ETag"]
+        setattr(obj, field, value)
+        obj.save()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+
+
+def test_repo_fixture_loads_with_updated_at():
+    call_command("loaddata", FIXTURE, verbosity=0)
+    post = Post.objects.first()
+    assert post.updated_at is not None
+    loaded_at = post.updated_at
+    post.save()
+    assert post.updated_at > loaded_at
+
+
+def test_profile_etag_follows_profile_edits(user, user_client):
+    url = f"/profile/{user.username}/"
+    etag = user_client.get(url)["ETag"]
+    response = user_client.post(
+        "/edit_profile/",
+        {
+            "username": user.username,
+            "email": "new@example.com",
+            "first_name": "Новое",
+            "last_name": "Имя",
+        },
+    )
+    assert response.status_code == HTTPStatus.FOUND
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert "Новое Имя" in response.content.decode()
+
+
+def test_post_detail_etag_follows_commenters(
+        mixer, another_user, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.blend("blog.Comment", post=post, author=another_user)
+    url = f"/posts/{post.id}/"
+    client = Client()
+    etag = client.get(url)["ETag"]
+    another_user.username = "renamed_commenter"
+    another_user.save()
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert "renamed_commenter" in response.content.decode()
@@ -0,0 +1,61 @@
+from http import HTTPStatus
+
+import pytest
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def cursor_pagination(settings):
+    settings.POSTS_CURSOR_PAGINATION = True
+
+
+def _page_ids(response):
+    return [post.id for post in response.context["page_obj"]]
+
+
+@pytest.mark.usefixtures("cursor_pagination")
+def test_cursor_pages_walk_feed(
+        user_client, many_posts_with_published_locations
+):
+    expected_ids = [
+        post.id for post in sorted(
+            many_posts_with_published_locations,
+            key=lambda post: (post.pub_date, post.id),
+            reverse=True,
+        )
+    ]
+    first = user_client.get("/")
+    assert first.status_code == HTTPStatus.OK
+    first_page = first.context["page_obj"]
+    assert first_page.cursor_based
+    assert not first_page.has_previous()
+    assert _page_ids(first) == expected_ids[:N_PER_PAGE]
+
+    second = user_client.get(f"/?cursor={first_page.next_cursor}")
+    second_page = second.context["page_obj"]
+    assert _page_ids(second) == expected_ids[N_PER_PAGE:N_PER_PAGE * 2]
+    assert not second_page.has_next()
+    assert f"?cursor={second_page.previous_cursor}" in second.content.decode()
+
+    back = user_client.get(f"/?cursor={second_page.previous_cursor}")
+    assert _page_ids(back) == expected_ids[:N_PER_PAGE]
+
+
+@pytest.mark.usefixtures("cursor_pagination")
+def test_page_number_links_keep_working(
+        user_client, user, many_posts_with_published_locations
+):
+    for url in ("/?page=2", f"/profile/{user.username}/?page=2"):
+        response = user_client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        page = response.context["page_obj"]
+        assert page.number == 2
+        assert len(page) == N_PER_PAGE
+
+
+def test_invalid_cursor_returns_404(user_client):
+    response = user_client.get("/?cursor=not-a-cursor")
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,82 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    page = response.context["page_obj"]
+    return page.paginator.count, [
+        query["sql"] for query in context.captured_queries
+        if query["sql"].startswith("SELECT COUNT(")
+    ]
+
+
+def test_feed_count_is_cached(
+        user_client, many_posts_with_published_locations
+):
+    count, count_queries = _count_queries(user_client, "/")
+    assert count == len(many_posts_with_published_locations)
+    assert len(count_queries) == 1
+    assert "GROUP BY" not in count_queries[0]
+
+    count, count_queries = _count_queries(user_client, "/")
+    assert count == len(many_posts_with_published_locations)
+    assert not count_queries
+
+
+def test_feed_count_invalidated_on_post_changes(
+        user_client, many_posts_with_published_locations
+):
+    _count_queries(user_client, "/")
+    post = many_posts_with_published_locations[0]
+    post.is_published = False
+    post.save()
+    count, count_queries = _count_queries(user_client, "/")
+    assert count == len(many_posts_with_published_locations) - 1
+    assert count_queries
+
+    post.delete()
+    count, _ = _count_queries(user_client, "/")
+    assert count == len(many_posts_with_published_locations) - 1
+
+
+def test_feed_count_approximate_above_threshold(
+        settings, user_client, user, many_posts_with_published_locations
+):
+    settings.POSTS_COUNT_APPROXIMATE_THRESHOLD = 5
+    url = f"/profile/{user.username}/"
+    count, _ = _count_queries(user_client, url)
+    assert count == len(many_posts_with_published_locations)
+
+    count, count_queries = _count_queries(user_client, url)
+    assert count == len(many_posts_with_published_locations)
+    assert not count_queries
+
+    many_posts_with_published_locations[0].delete()
+    count, _ = _count_queries(user_client, url)
+    assert count == len(many_posts_with_published_locations) - 1
+
+
+def test_moving_post_invalidates_both_categories(
+        mixer, user_client, published_category,
+        many_posts_with_published_locations
+):
+    other = mixer.blend("blog.Category", is_published=True)
+    old_url = f"/category/{published_category.slug}/"
+    new_url = f"/category/{other.slug}/"
+    _count_queries(user_client, old_url)
+    _count_queries(user_client, new_url)
+
+    post = Post.objects.get(pk=many_posts_with_published_locations[0].pk)
+    post.category = other
+    post.save()
+    assert _count_queries(user_client, old_url)[0] == len(
+        many_posts_with_published_locations
+    ) - 1
+    assert _count_queries(user_client, new_url)[0] == 1
@@ -0,0 +1,107 @@
+from datetime import timedelta
+from http import HTTPStatus
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
+from PIL import Image
+
+from core.jobs import enqueue, requeue_stale_jobs, run_pending_jobs
+from core.models import Job
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+CALLS = []
+
+
+def remember(*args, **kwargs):
+    CALLS.append((args, kwargs))
+
+
+def explode():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CALLS.clear()
+
+
+def test_enqueued_job_runs_once():
+    job = enqueue(remember, 1, "two", three=3)
+    assert Job.objects.get(pk=job.pk).status == Job.PENDING
+    assert run_pending_jobs() == [True]
+    assert CALLS == [((1, "two"), {"three": 3})]
+    assert Job.objects.get(pk=job.pk).status == Job.DONE
+    assert run_pending_jobs() == []
+
+
+def test_delayed_job_waits():
+    enqueue(remember, delay=60)
+    assert run_pending_jobs() == []
+
+
+def test_failed_job_is_retried_then_given_up():
+    job = enqueue(explode, max_attempts=2)
+    assert run_pending_jobs() == [False]
+    job.refresh_from_db()
+    assert job.status == Job.PENDING and job.attempts == 1
+    assert job.run_at > timezone.now()
+    assert "RuntimeError: boom" in job.last_error
+
+    Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+    assert run_pending_jobs() == [False]
+    job.refresh_from_db()
+    assert job.status == Job.FAILED and job.attempts == 2
+
+
+def test_stale_running_jobs_are_requeued(settings):
+    job = enqueue(remember)
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.RUNNING,
+        updated_at=timezone.now() - timedelta(
+            seconds=settings.JOBS_STALE_TIMEOUT + 1
+        ),
+    )
+    assert requeue_stale_jobs() == 1
+    assert run_pending_jobs() == [True]
+
+
+def test_eager_mode_skips_the_table(settings):
+    settings.JOBS_EAGER = True
+    enqueue(remember, 1)
+    assert CALLS == [((1,), {})]
+    assert not Job.objects.exists()
+
+
+def test_run_jobs_command(capsys):
+    enqueue(remember)
+    enqueue(explode, max_attempts=1)
+    call_command("run_jobs", "--once")
+    assert "Выполнено задач: 1, с ошибкой: 1" in capsys.readouterr().out
+
+
+def test_post_view_defers_thumbnails(
+        user_client, published_category, published_location
+):
+    buffer = BytesIO()
+    Image.new("RGB", (1600, 1200)).save(buffer, format="PNG")
+    response = user_client.post(
+        "/posts/create/",
+        {
+            "title": "Фото",
+            "text": "Текст",
+            "pub_date": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "category": published_category.id,
+            "location": published_location.id,
+            "image": SimpleUploadedFile(
+                "photo.png", buffer.getvalue(), "image/png"
+            ),
+        },
+    )
+    assert response.status_code == HTTPStatus.FOUND
+    job = Job.objects.get()
+    assert job.name == "blog.thumbnails.generate_post_thumbnails"
+    assert job.status == Job.PENDING
@@ -0,0 +1,132 @@
+import pytest
+from django.core.management import call_command
+from django.test import Client
+
+from blog.models import Comment, Post
+from blog.moderation import publish_posts, unpublish_posts
+from blog.search import search_posts
+from core.jobs import run_pending_jobs
+from core.models import Job
+
+pytestmark = [pytest.mark.django_db]
+
+POSTS_URL = "/admin/blog/post/"
+
+
+@pytest.fixture
+def posts(mixer, user, published_category):
+    return mixer.cycle(5).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        title="Спам",
+        image="",
+    )
+
+
+def _run_action(admin_client, action, posts, **data):
+    return admin_client.post(
+        POSTS_URL,
+        {
+            "action": action,
+            "_selected_action": [post.id for post in posts],
+            **data,
+        },
+        follow=True,
+    )
+
+
+def test_unpublish_runs_in_batches_and_invalidates_feeds(
+        posts, django_assert_max_num_queries
+):
+    client = Client()
+    assert len(client.get("/").context["page_obj"]) == 5
+    progress = []
+    with django_assert_max_num_queries(20) as captured:
+        updated = unpublish_posts(
+            Post.objects.all(), batch_size=2, progress=progress.append
+        )
+    assert updated == 5
+    assert progress == [2, 4, 5]
+    updates = [
+        query["sql"] for query in captured.captured_queries
+        if query["sql"].startswith("UPDATE")
+    ]
+    assert len(updates) == 3
+    assert not Post.objects.filter(is_published=True).exists()
+    assert len(client.get("/").context["page_obj"]) == 0
+    assert publish_posts(Post.objects.all()) == 5
+    assert len(client.get("/").context["page_obj"]) == 5
+
+
+def test_admin_publish_actions(admin_client, posts):
+    response = _run_action(admin_client, "unpublish_selected", posts[:2])
+    assert "Снято с публикации публикаций: 2" in response.content.decode()
+    assert Post.objects.filter(is_published=False).count() == 2
+    response = _run_action(admin_client, "publish_selected", posts)
+    assert "Опубликовано публикаций: 2" in response.content.decode()
+
+
+def test_admin_move_action(mixer, admin_client, posts):
+    category = mixer.blend("blog.Category", is_published=True)
+    response = _run_action(admin_client, "move_selected", posts[:3])
+    assert "Выберите категорию" in response.content.decode()
+    _run_action(
+        admin_client, "move_selected", posts[:3], category=category.id
+    )
+    assert Post.objects.filter(category=category).count() == 3
+    assert len(
+        Client().get(f"/category/{category.slug}/").context["page_obj"]
+    ) == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_purge_authors(
+        mixer, admin_client, user, another_user, posts, published_category
+):
+    other_post = mixer.blend(
+        "blog.Post", author=another_user, category=published_category
+    )
+    mixer.cycle(2).blend("blog.Comment", post=other_post, author=user)
+    kept = mixer.blend("blog.Comment", post=other_post, author=another_user)
+    mixer.blend("blog.Comment", post=posts[0], author=another_user)
+    Post.objects.filter(pk=posts[1].pk).update(image="posts_images/a.jpg")
+
+    response = _run_action(
+        admin_client, "purge_selected_authors", posts[:1]
+    )
+    content = response.content.decode()
+    assert "Будут удалены все публикации (5) и комментарии" in content
+    assert Post.objects.count() == 6
+
+    response = _run_action(
+        admin_client, "purge_selected_authors", posts[:1], post="yes"
+    )
+    assert "поставлено в очередь: 1" in response.content.decode()
+    assert Post.objects.count() == 6
+    assert all(run_pending_jobs())
+    assert list(Post.objects.all()) == [other_post]
+    assert list(Comment.objects.all()) == [kept]
+    other_post.refresh_from_db()
+    assert other_post.comment_count == 1
+    assert not search_posts(Post.objects.all(), "спам").exists()
+    job = Job.objects.get(name__endswith="delete_posts_thumbnails")
+    assert job.args == [["posts_images/a.jpg"]]
+
+
+def test_moderate_posts_command(capsys, mixer, user, posts):
+    call_command(
+        "moderate_posts", "--unpublish", "--author", user.username,
+        "--batch-size", "3",
+    )
+    out = capsys.readouterr().out
+    assert "Публикации: 3 из 5" in out
+    assert "Изменено публикаций: 5" in out
+
+    mixer.blend("blog.Comment", post=posts[0], author=user)
+    call_command("moderate_posts", "--purge-user", user.username)
+    out = capsys.readouterr().out
+    assert "Публикации: 5 из 5" in out
+    assert "Удалено публикаций: 5, комментариев: 0" in out
+    assert not Post.objects.exists()
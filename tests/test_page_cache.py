@@ -0,0 +1,73 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _get(client, url):
+    with CaptureQueriesContext(connection) as context:
+        content = client.get(url).content.decode("utf-8")
+    return content, len(context.captured_queries)
+
+
+@pytest.fixture
+def feed_urls(user, post_with_published_location):
+    return (
+        "/",
+        f"/category/{post_with_published_location.category.slug}/",
+        f"/profile/{user.username}/",
+    )
+
+
+def test_anonymous_pages_are_cached(unlogged_client, feed_urls):
+    for url in feed_urls:
+        _, first_queries = _get(unlogged_client, url)
+        _, second_queries = _get(unlogged_client, url)
+        assert first_queries > second_queries
+        assert second_queries <= 1
+
+
+def test_cached_pages_follow_writes(
+        unlogged_client, another_user, feed_urls,
+        post_with_published_location
+):
+    post = post_with_published_location
+    for url in feed_urls:
+        _get(unlogged_client, url)
+
+    post.title = "Заголовок после правки"
+    post.save()
+    for url in feed_urls:
+        content, _ = _get(unlogged_client, url)
+        assert "Заголовок после правки" in content
+
+    post.comments.create(text="Комментарий", author=another_user)
+    for url in feed_urls:
+        content, _ = _get(unlogged_client, url)
+        assert "Комментарии (1)" in content
+
+
+def test_authors_bypass_page_cache(
+        unlogged_client, user_client, user, mixer, published_category
+):
+    url = f"/profile/{user.username}/"
+    _get(unlogged_client, url)
+    draft = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=False
+    )
+    content, _ = _get(user_client, url)
+    assert draft.title in content
+    content, _ = _get(unlogged_client, url)
+    assert draft.title not in content
+
+
+def test_cached_profile_follows_profile_edits(unlogged_client, user):
+    url = f"/profile/{user.username}/"
+    _get(unlogged_client, url)
+    user.first_name = "Обновлённое"
+    user.last_name = "Имя"
+    user.save()
+    content, _ = _get(unlogged_client, url)
+    assert "Обновлённое Имя" in content
@@ -0,0 +1,41 @@
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _index(client):
+    return client.get("/").content.decode("utf-8")
+
+
+def test_card_cache_follows_related_changes(
+        user_client, user, post_with_published_location
+):
+    post = post_with_published_location
+    assert post.title in _index(user_client)
+
+    post.title = "Обновлённый заголовок"
+    post.save()
+    assert "Обновлённый заголовок" in _index(user_client)
+
+    location = post.location
+    location.name = "Новое место"
+    location.save()
+    assert "Новое место" in _index(user_client)
+
+    category = post.category
+    category.title = "Новая категория"
+    category.save()
+    assert "Новая категория" in _index(user_client)
+
+    user.username = "renamed_author"
+    user.save()
+    assert "@renamed_author" in _index(user_client)
+
+
+def test_card_cache_skips_unrelated_user_saves(
+        user_client, user, post_with_published_location
+):
+    _index(user_client)
+    user.first_name = "Иван"
+    user.save(update_fields=["first_name"])
+    assert f"@{user.username}" in _index(user_client)
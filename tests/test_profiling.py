@@ -0,0 +1,64 @@
+import json
+import logging
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+
+from core.middleware import get_profiles
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_profiles():
+    get_profiles().clear()
+    yield
+    get_profiles().clear()
+
+
+@pytest.fixture
+def profiling(settings):
+    settings.PROFILING_SAMPLE_RATE = 1.0
+
+
+@pytest.fixture
+def staff_client(mixer):
+    client = Client()
+    client.force_login(mixer.blend("auth.User", is_staff=True))
+    return client
+
+
+@pytest.mark.usefixtures("profiling")
+def test_requests_are_profiled(
+        monkeypatch, caplog, post_with_published_location
+):
+    logger = logging.getLogger("blogicum.profiling")
+    monkeypatch.setattr(logger, "handlers", [caplog.handler])
+    client = Client()
+    client.get("/")
+    client.get("/")
+    cold, warm = get_profiles()
+    assert cold["path"] == "/" and cold["status"] == HTTPStatus.OK
+    assert cold["queries"] > 0 and cold["sql_ms"] >= 0
+    assert cold["template_ms"] > 0
+    assert cold["cache_misses"] > 0
+    assert warm["queries"] == 0 and warm["cache_hits"] > 0
+    logged = [json.loads(record.message) for record in caplog.records]
+    assert logged == [cold, warm]
+
+
+def test_profiling_is_off_by_default(client):
+    client.get("/")
+    assert not get_profiles()
+
+
+@pytest.mark.usefixtures("profiling")
+def test_profiling_endpoint_is_staff_only(user_client, staff_client):
+    user_client.get("/")
+    response = user_client.get("/admin/profiling/")
+    assert response.status_code == HTTPStatus.FOUND
+    response = staff_client.get("/admin/profiling/")
+    assert response.status_code == HTTPStatus.OK
+    paths = [profile["path"] for profile in response.json()["requests"]]
+    assert paths == ["/admin/profiling/", "/"]
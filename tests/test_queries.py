@@ -0,0 +1,139 @@
+import re
+from io import StringIO
+
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+CARD_COLUMNS = {
+    '"blog_post"."id"',
+    '"blog_post"."is_published"',
+    '"blog_post"."title"',
+    '"blog_post"."image"',
+    '"blog_post"."thumbnails"',
+    '"blog_post"."pub_date"',
+    '"blog_post"."author_id"',
+    '"blog_post"."location_id"',
+    '"blog_post"."category_id"',
+    '"blog_post"."comment_count"',
+    'SUBSTR("blog_post"."text", 1, 300) AS "text_preview"',
+    '"auth_user"."id"',
+    '"auth_user"."username"',
+    '"blog_location"."id"',
+    '"blog_location"."is_published"',
+    '"blog_location"."name"',
+    '"blog_category"."id"',
+    '"blog_category"."is_published"',
+    '"blog_category"."title"',
+    '"blog_category"."slug"',
+}
+
+
+def _feed_urls(user, post):
+    return {
+        "index": "/",
+        "category": f"/category/{post.category.slug}/",
+        "profile": f"/profile/{user.username}/",
+    }
+
+
+def _selected_columns(sql):
+    columns = sql[len("SELECT "):sql.index(' FROM "blog_post"')]
+    return set(re.split(r", (?!\d)", columns))
+
+
+@pytest.mark.parametrize(
+    ("view", "anonymous_queries", "author_queries"),
+    [("index", 4, 6), ("category", 5, 7), ("profile", 5, 6)],
+)
+def test_feed_queries_use_card_projection(
+        unlogged_client, user_client, user,
+        many_posts_with_published_locations,
+        view, anonymous_queries, author_queries
+):
+    url = _feed_urls(user, many_posts_with_published_locations[0])[view]
+    for client, expected_queries in (
+        (unlogged_client, anonymous_queries),
+        (user_client, author_queries),
+    ):
+        caches["default"].clear()
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == 200
+        assert len(context.captured_queries) == expected_queries
+        page_query = context.captured_queries[-1]["sql"]
+        assert "LEFT OUTER JOIN \"blog_location\"" in page_query
+        assert _selected_columns(page_query) == CARD_COLUMNS
+
+
+def test_post_detail_is_two_queries(
+        mixer, unlogged_client, django_assert_num_queries,
+        post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(5).blend("blog.Comment", post=post)
+    with django_assert_num_queries(2):
+        response = unlogged_client.get(f"/posts/{post.id}/")
+    assert response.status_code == 200
+
+
+def _post_selects(captured_queries):
+    return [
+        query["sql"] for query in captured_queries
+        if query["sql"].startswith("SELECT")
+        and 'FROM "blog_post"' in query["sql"]
+    ]
+
+
+@pytest.mark.parametrize("action", ["edit", "delete"])
+def test_post_actions_load_post_once(
+        user_client, post_with_published_location, action
+):
+    post = post_with_published_location
+    with CaptureQueriesContext(connection) as context:
+        response = user_client.get(f"/posts/{post.id}/{action}/")
+    assert response.status_code == 200
+    assert len(_post_selects(context.captured_queries)) == 1
+
+
+FEED_INDEXES = {
+    "index": "blog_post USING INDEX post_published_feed_idx",
+    "category": "blog_post USING INDEX post_category_feed_idx",
+    "profile": "blog_post USING INDEX post_author_feed_idx",
+    "profile (author)": "blog_post USING INDEX post_author_feed_idx",
+    "comments": "blog_comment USING INDEX comment_post_created_idx",
+}
+
+
+def _explained_plans(output):
+    plans = {}
+    for line in output.splitlines():
+        name, separator, _ = line.partition(": ")
+        if separator and name in FEED_INDEXES:
+            plan = plans[name] = []
+        else:
+            plan.append(line)
+    return plans
+
+
+def test_explain_feeds_plans_use_feed_indexes(
+        mixer, user, many_posts_with_published_locations
+):
+    post = many_posts_with_published_locations[0]
+    mixer.cycle(3).blend("blog.Comment", post=post, author=user)
+    out = StringIO()
+    call_command(
+        "explain_feeds", "--author", user.username, "--post", post.id,
+        stdout=out,
+    )
+    plans = _explained_plans(out.getvalue())
+    assert plans.keys() == FEED_INDEXES.keys()
+    for name, index in FEED_INDEXES.items():
+        plan = "\n".join(plans[name])
+        assert f"SEARCH {index}" in plan
+        assert "SCAN" not in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,102 @@
+from http import HTTPStatus
+
+import pytest
+
+from blog.mixins import PostFeedMixin
+
+pytestmark = [pytest.mark.django_db]
+
+N_POSTS = 25
+N_COMMENTS = 30
+PAGE_SIZES = (1, 10, 50)
+
+FEED_BUDGETS = {
+    "index": (4, 6),
+    "category": (5, 7),
+    "profile": (5, 6),
+}
+AUTHOR_BUDGETS = {
+    "detail": 4,
+    "comments": 4,
+    "create": 4,
+    "edit": 5,
+    "delete": 3,
+    "edit_comment": 3,
+    "delete_comment": 3,
+    "edit_profile": 2,
+}
+
+
+@pytest.fixture
+def blog(mixer, user, published_category, published_location):
+    posts = mixer.cycle(N_POSTS).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=published_location,
+    )
+    post = posts[0]
+    comments = mixer.cycle(N_COMMENTS).blend(
+        "blog.Comment", post=post, author=user
+    )
+    return post, comments[0]
+
+
+def _feed_url(view, post):
+    return {
+        "index": "/",
+        "category": f"/category/{post.category.slug}/",
+        "profile": f"/profile/{post.author.username}/",
+    }[view]
+
+
+def _author_url(view, post, comment):
+    return {
+        "detail": f"/posts/{post.id}/",
+        "comments": f"/posts/{post.id}/comments/",
+        "create": "/posts/create/",
+        "edit": f"/posts/{post.id}/edit/",
+        "delete": f"/posts/{post.id}/delete/",
+        "edit_comment": f"/posts/{post.id}/edit_comment/{comment.id}/",
+        "delete_comment": f"/posts/{post.id}/delete_comment/{comment.id}/",
+        "edit_profile": "/edit_profile/",
+    }[view]
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+@pytest.mark.parametrize("view", FEED_BUDGETS)
+def test_feed_query_budget(
+        monkeypatch, assert_max_queries, unlogged_client, user_client, blog,
+        view, page_size
+):
+    monkeypatch.setattr(PostFeedMixin, "paginate_by", page_size)
+    url = _feed_url(view, blog[0])
+    for client, limit in zip(
+        (unlogged_client, user_client), FEED_BUDGETS[view]
+    ):
+        with assert_max_queries(limit, f"{url} по {page_size}"):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.context["page_obj"]) == min(page_size, N_POSTS)
+
+
+@pytest.mark.parametrize("view", AUTHOR_BUDGETS)
+def test_author_view_query_budget(
+        assert_max_queries, user_client, blog, view
+):
+    url = _author_url(view, *blog)
+    with assert_max_queries(AUTHOR_BUDGETS[view], url):
+        response = user_client.get(url)
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_budget_failure_names_sql_and_template(
+        assert_max_queries, unlogged_client, blog
+):
+    with pytest.raises(pytest.fail.Exception) as error:
+        with assert_max_queries(0, "/"):
+            unlogged_client.get("/")
+    message = str(error.value)
+    assert 'FROM "blog_post"' in message
+    assert "шаблон: blog/index.html:" in message
+    assert "код: blog/feeds.py:" in message
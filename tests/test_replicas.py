@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from blog.models import Post
+from core.middleware import PRIMARY_PIN_COOKIE
+from core.routers import ReplicaRouter, track_reads
+
+pytestmark = [pytest.mark.django_db(databases=["default", "replica"])]
+
+
+@pytest.fixture
+def replica(settings):
+    settings.REPLICA_DATABASES = ["replica"]
+    return "replica"
+
+
+@pytest.fixture
+def lagging_post(mixer, user, published_category, replica):
+    post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=None,
+        image="",
+        is_published=True,
+        pub_date=timezone.now() - timedelta(days=1),
+        title="Старый заголовок",
+    )
+    for obj in (user, published_category, post):
+        obj.save(using=replica, force_insert=True)
+    Post.objects.filter(pk=post.pk).update(title="Новый заголовок")
+    return post
+
+
+def test_safe_reads_go_to_replica(lagging_post):
+    client = Client()
+    for url in ("/", f"/posts/{lagging_post.id}/"):
+        content = client.get(url).content.decode()
+        assert "Старый заголовок" in content
+        assert "Новый заголовок" not in content
+
+
+def test_author_is_pinned_to_primary_after_write(
+        user_client, lagging_post
+):
+    url = f"/posts/{lagging_post.id}/"
+    response = user_client.post(f"{url}comment/", {"text": "Свежий ответ"})
+    assert response.cookies[PRIMARY_PIN_COOKIE]["max-age"] == 10
+
+    content = user_client.get(url).content.decode()
+    assert "Новый заголовок" in content
+    assert "Свежий ответ" in content
+
+    content = Client().get(url).content.decode()
+    assert "Старый заголовок" in content
+    assert "Свежий ответ" not in content
+
+
+def test_other_views_and_code_read_primary(admin_client, lagging_post):
+    response = admin_client.get(f"/admin/blog/post/{lagging_post.id}/change/")
+    assert "Новый заголовок" in response.content.decode()
+    assert Post.objects.get(pk=lagging_post.pk).title == "Новый заголовок"
+
+
+def test_router_sticks_to_primary_after_write(replica):
+    router = ReplicaRouter()
+    assert router.db_for_read(Post) is None
+    with track_reads() as reads:
+        reads.use_replica()
+        assert router.db_for_read(Post) == replica
+        assert router.db_for_write(Post) is None
+        assert router.db_for_read(Post) is None
+    replica_post = Post()
+    replica_post._state.db = replica
+    assert router.db_for_write(Post, instance=replica_post) == "default"
+    primary_post = Post()
+    primary_post._state.db = "default"
+    assert router.allow_relation(replica_post, primary_post)
+
+
+def test_replica_reads_do_not_fill_caches(lagging_post):
+    client = Client()
+    for url in ("/", f"/posts/{lagging_post.id}/"):
+        assert "ETag" not in client.get(url)
+    Post.objects.using("replica").filter(pk=lagging_post.pk).update(
+        title="Новый заголовок"
+    )
+    content = client.get("/").content.decode()
+    assert "Новый заголовок" in content
+    assert "Старый заголовок" not in content
+
+
+def test_replicas_are_not_migrated(replica):
+    router = ReplicaRouter()
+    assert router.allow_migrate(replica, "blog") is False
+    assert router.allow_migrate("default", "blog") is None
@@ -0,0 +1,68 @@
+import threading
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.apps import apps
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from blog.feeds import INDEX_FEED
+from blog.models import Post
+from blog.schedule import publication_timeout, release_due_posts
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def scheduled_post(mixer, user, published_category):
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(hours=1),
+    )
+
+
+def test_timeout_ends_at_next_publication(scheduled_post):
+    timeout = publication_timeout(INDEX_FEED, Post.objects.all(), 60 * 60 * 24)
+    assert 0 < timeout <= 60 * 60 + 1
+    assert publication_timeout(INDEX_FEED, Post.objects.all(), 60) == 60
+
+
+def test_release_invalidates_cached_feeds(unlogged_client, scheduled_post):
+    release_due_posts()
+    assert scheduled_post.title not in unlogged_client.get("/").content.decode()
+
+    Post.objects.filter(pk=scheduled_post.pk).update(pub_date=timezone.now())
+    assert scheduled_post.title not in unlogged_client.get("/").content.decode()
+
+    released = release_due_posts()
+    assert [post["id"] for post in released] == [scheduled_post.pk]
+    assert scheduled_post.title in unlogged_client.get("/").content.decode()
+
+
+def test_scheduler_thread_is_not_started_on_setup(settings):
+    settings.POSTS_SCHEDULER_ENABLED = True
+    apps.get_app_config("blog").ready()
+    assert "publication-scheduler" not in {
+        thread.name for thread in threading.enumerate()
+    }
+
+
+def test_command_requires_shared_cache(settings, tmp_path, scheduled_post):
+    with pytest.raises(CommandError):
+        call_command("publish_scheduled")
+    settings.CACHES = {
+        **settings.CACHES,
+        "shared": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        },
+    }
+    settings.POSTS_CACHE_ALIAS = "shared"
+    Post.objects.filter(pk=scheduled_post.pk).update(pub_date=timezone.now())
+    out = StringIO()
+    call_command("publish_scheduled", stdout=out)
+    assert "Опубликовано постов: 1" in out.getvalue()
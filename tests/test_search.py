@@ -0,0 +1,179 @@
+from datetime import timedelta
+from io import StringIO
+
+import debug_toolbar
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from django.urls import include, path
+from django.utils import timezone
+
+from blog import search
+from blog.models import Post
+from blog.search import stem, tokenize
+from blog.signals import populate_search_index
+from blogicum.urls import urlpatterns as project_urlpatterns
+
+pytestmark = [pytest.mark.django_db]
+
+urlpatterns = [
+    *project_urlpatterns,
+    path("__debug__/", include(debug_toolbar.urls)),
+]
+
+
+@pytest.fixture
+def blend_post(mixer, user, published_category):
+    def blend(title, text="", **kwargs):
+        kwargs.setdefault("category", published_category)
+        return mixer.blend(
+            "blog.Post", author=user, title=title, text=text, **kwargs
+        )
+
+    return blend
+
+
+def _found(client, query):
+    response = client.get("/search/", {"q": query})
+    assert response.status_code == 200
+    return [post.id for post in response.context["page_obj"]]
+
+
+@pytest.mark.parametrize(
+    ("words", "expected"),
+    [
+        (("публикация", "публикации", "публикаций"), "публикац"),
+        (("красивая", "красивый", "красивые"), "красив"),
+        (("читали", "читать"), "чита"),
+        (("книги", "книгой"), "книг"),
+    ],
+)
+def test_russian_stemming(words, expected):
+    assert {stem(word) for word in words} == {expected}
+
+
+def test_tokenize_normalises_case_and_yo():
+    assert tokenize("Ёлки, Python 3!") == ["елк", "python", "3"]
+
+
+def test_search_finds_inflected_forms_and_ranks_titles(client, blend_post):
+    in_text = blend_post("Утро", "Мы долго читали старые книги.")
+    in_title = blend_post("Книга дня", "Без слов.")
+    blend_post("Другое", "Ничего общего.")
+    assert _found(client, "книгой") == [in_title.id, in_text.id]
+    assert _found(client, "Читать книги") == [in_text.id]
+
+
+def test_search_respects_visibility(
+        mixer, client, blend_post, published_category
+):
+    visible = blend_post("Зимний лес")
+    blend_post("Зимний лес", is_published=False)
+    blend_post(
+        "Зимний лес", pub_date=timezone.now() + timedelta(days=1)
+    )
+    blend_post(
+        "Зимний лес",
+        category=mixer.blend("blog.Category", is_published=False),
+    )
+    assert _found(client, "лес") == [visible.id]
+
+
+def test_index_follows_edits_and_deletes(client, blend_post):
+    post = blend_post("Горы", "Поход в горы.")
+    post.title = "Море"
+    post.text = "Отдых на море."
+    post.save()
+    assert _found(client, "горы") == []
+    assert _found(client, "морем") == [post.id]
+    post.delete()
+    assert _found(client, "море") == []
+
+
+def test_empty_query_returns_nothing(client, blend_post):
+    blend_post("Пост")
+    assert _found(client, "") == []
+    assert _found(client, "!!!") == []
+
+
+def test_pagination_keeps_query(client, blend_post):
+    for number in range(12):
+        blend_post(f"Река {number}")
+    response = client.get("/search/", {"q": "река"})
+    assert len(response.context["page_obj"]) == 10
+    assert "?q=%D1%80%D0%B5%D0%BA%D0%B0&amp;page=2" in (
+        response.content.decode()
+    )
+
+
+def test_fallback_without_full_text_index(monkeypatch, client, blend_post):
+    post = blend_post("Рецепт пирога", "Мука и яблоки.")
+    monkeypatch.setattr(search, "search_available", lambda alias: False)
+    assert _found(client, "пирога") == [post.id]
+    assert _found(client, "пирог яблоки") == [post.id]
+    assert _found(client, "торт") == []
+
+
+def test_rebuild_command(client, blend_post, capsys):
+    post = blend_post("Чай", "Зелёный чай.")
+    with search.connections["default"].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {search.SEARCH_TABLE}")
+    assert _found(client, "чай") == []
+    call_command("rebuild_search_index")
+    assert "Проиндексировано публикаций: 1" in capsys.readouterr().out
+    assert _found(client, "зеленый") == [post.id]
+
+
+def test_saving_post_with_debug_toolbar(
+        settings, user_client, published_category
+):
+    settings.DEBUG = True
+    settings.ROOT_URLCONF = __name__
+    response = user_client.post(
+        "/posts/create/",
+        {
+            "title": "Отладка",
+            "text": "Панель отладки включена.",
+            "pub_date": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "category": published_category.id,
+        },
+    )
+    assert response.status_code == 302
+    assert _found(user_client, "отладка")
+
+
+def test_seeded_posts_are_searchable(client):
+    call_command(
+        "seed_blog", users=2, categories=1, locations=0, posts=20,
+        comments=0, scheduled=0, unpublished=0, stdout=StringIO(),
+    )
+    post = Post.objects.filter(category__is_published=True).first()
+    assert post.id in _found(client, post.title)
+
+
+def test_empty_index_is_filled_after_migrate(client, blend_post):
+    post = blend_post("Осенний сад")
+    with search.connections["default"].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {search.SEARCH_TABLE}")
+    populate_search_index(apps.get_app_config("blog"), using="default")
+    assert _found(client, "сад") == [post.id]
+
+
+def test_fixture_loads_do_not_touch_index(client, blend_post, tmp_path):
+    post = blend_post("Горный мёд")
+    fixture = tmp_path / "blog.json"
+    call_command("dumpdata", "blog.post", output=str(fixture))
+    Post.objects.all().delete()
+    call_command("loaddata", str(fixture), verbosity=0)
+    assert _found(client, "мед") == []
+    call_command("rebuild_search_index", stdout=StringIO())
+    assert _found(client, "мед") == [post.id]
+
+
+def test_dumped_index_rows_load_back(client, blend_post, tmp_path):
+    post = blend_post("Липовый мёд")
+    fixture = tmp_path / "blog.json"
+    call_command("dumpdata", "blog", output=str(fixture))
+    Post.objects.all().delete()
+    call_command("loaddata", str(fixture), verbosity=0)
+    assert _found(client, "мед") == [post.id]
@@ -0,0 +1,73 @@
+from datetime import datetime
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from blog.models import Category, Comment, Location, Post
+
+pytestmark = [pytest.mark.django_db]
+
+NOW = "2024-03-01T12:00:00"
+
+
+def _seed(**options):
+    options.setdefault("now", NOW)
+    call_command(
+        "seed_blog", users=3, categories=2, locations=2, posts=30,
+        comments=40, stdout=StringIO(), **options,
+    )
+
+
+def _snapshot():
+    return list(
+        Post.objects.order_by("id").values_list(
+            "title", "text", "pub_date", "is_published",
+            "author__username", "category__slug", "location__name",
+        )
+    )
+
+
+def _clear():
+    Post.objects.all().delete()
+    Category.objects.all().delete()
+    Location.objects.all().delete()
+    get_user_model().objects.all().delete()
+
+
+def test_same_seed_and_date_give_same_data():
+    _seed(seed=7)
+    first = _snapshot()
+    _clear()
+    _seed(seed=7)
+    assert _snapshot() == first
+    assert Comment.objects.count() == 40
+
+
+def test_identifiers_come_from_seed():
+    _seed(seed=7)
+    usernames = get_user_model().objects.values_list("username", flat=True)
+    assert sorted(usernames) == ["seed7_user0", "seed7_user1", "seed7_user2"]
+    assert Category.objects.filter(slug="seed7-category0").exists()
+
+
+def test_dates_follow_reference_date():
+    _seed(seed=7, scheduled=0)
+    now = timezone.make_aware(datetime.fromisoformat(NOW))
+    assert Post.objects.latest("pub_date").pub_date < now
+    assert get_user_model().objects.filter(date_joined=now).count() == 3
+
+
+def test_invalid_reference_date_is_refused():
+    with pytest.raises(CommandError):
+        _seed(seed=7, now="вчера")
+
+
+def test_repeated_seed_is_refused():
+    _seed(seed=7)
+    with pytest.raises(CommandError):
+        _seed(seed=7)
+    _seed(seed=8)
+    assert get_user_model().objects.count() == 6
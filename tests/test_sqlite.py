@@ -0,0 +1,41 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+from django.db import connection
+
+from blog.models import Category
+from core.sqlite import read_pragmas
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_connection_uses_tuned_profile(settings):
+    pragmas = read_pragmas(
+        connection, ("journal_mode", "synchronous", "busy_timeout")
+    )
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "busy_timeout": settings.SQLITE_PRAGMAS["busy_timeout"],
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_locked_write_waits_for_busy_timeout(mixer):
+    category = mixer.blend("blog.Category")
+    other = sqlite3.connect(
+        connection.settings_dict["NAME"], check_same_thread=False
+    )
+    other.execute("BEGIN IMMEDIATE")
+    release = threading.Timer(0.3, other.commit)
+    release.start()
+    started = time.monotonic()
+    try:
+        Category.objects.filter(pk=category.pk).update(title="Обновлено")
+    finally:
+        release.join()
+        other.close()
+    assert time.monotonic() - started >= 0.25
+    assert Category.objects.get(pk=category.pk).title == "Обновлено"
@@ -0,0 +1,100 @@
+import gzip
+
+import pytest
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import Client
+
+from core.staticfiles import CompressedStaticFiles, accepted_encodings
+
+pytestmark = [pytest.mark.django_db]
+
+BOOTSTRAP = "css/bootstrap.min.css"
+
+
+@pytest.fixture
+def collected(settings, tmp_path):
+    settings.STATIC_ROOT = tmp_path / "static"
+    call_command("collectstatic", "--noinput", verbosity=0)
+    return settings.STATIC_ROOT
+
+
+@pytest.fixture
+def app(collected):
+    def fallback(environ, start_response):
+        start_response("404 Not Found", [])
+        return [b"fallback"]
+
+    return CompressedStaticFiles(fallback, root=collected, prefix="/static/")
+
+
+def _get(app, path, accept_encoding=""):
+    captured = {}
+
+    def start_response(status, headers):
+        captured["status"] = status
+        captured["headers"] = dict(headers)
+
+    body = b"".join(
+        app(
+            {
+                "PATH_INFO": path,
+                "REQUEST_METHOD": "GET",
+                "HTTP_ACCEPT_ENCODING": accept_encoding,
+            },
+            start_response,
+        )
+    )
+    return captured["status"], captured["headers"], body
+
+
+def test_collectstatic_fingerprints_and_compresses(collected):
+    hashed = staticfiles_storage.stored_name(BOOTSTRAP)
+    assert hashed != BOOTSTRAP
+    original = (collected / BOOTSTRAP).read_bytes()
+    assert gzip.decompress((collected / f"{hashed}.gz").read_bytes()) == (
+        original
+    )
+    assert not (collected / "img/logo.png.gz").exists()
+
+
+def test_templates_use_hashed_urls(collected):
+    content = Client().get("/").content.decode()
+    assert staticfiles_storage.url("img/logo.png") in content
+    assert staticfiles_storage.url("img/fav/favicon.ico") in content
+    assert 'href="/static/img/fav/favicon.ico"' not in content
+
+
+def test_missing_manifest_falls_back_to_plain_urls():
+    assert staticfiles_storage.url(BOOTSTRAP) == f"/static/{BOOTSTRAP}"
+
+
+def test_serves_precompressed_hashed_files(app, collected):
+    hashed = staticfiles_storage.stored_name(BOOTSTRAP)
+    status, headers, body = _get(app, f"/static/{hashed}", "br;q=0, gzip")
+    assert status == "200 OK"
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Content-Type"] == "text/css"
+    assert headers["Vary"] == "Accept-Encoding"
+    assert "immutable" in headers["Cache-Control"]
+    assert gzip.decompress(body) == (collected / BOOTSTRAP).read_bytes()
+
+
+def test_serves_identity_without_accept_encoding(app, collected):
+    status, headers, body = _get(app, f"/static/{BOOTSTRAP}")
+    assert "Content-Encoding" not in headers
+    assert "immutable" not in headers["Cache-Control"]
+    assert body == (collected / BOOTSTRAP).read_bytes()
+
+
+@pytest.mark.parametrize(
+    "path", ["/static/missing.css", "/static/../manage.py", "/posts/1/"]
+)
+def test_other_paths_reach_the_application(app, path):
+    assert _get(app, path)[2] == b"fallback"
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, br;q=0, deflate;q=0.5") == {
+        "gzip", "deflate"
+    }
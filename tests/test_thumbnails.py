@@ -0,0 +1,151 @@
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+from blog.models import Post
+from blog.thumbnails import thumbnail_name, thumbnail_names
+from core.jobs import run_pending_jobs
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+
+def _upload(name="photo.png", size=(2000, 1500)):
+    buffer = BytesIO()
+    Image.new("RGB", size, "teal").save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), "image/png")
+
+
+@pytest.fixture
+def photo_post(mixer, user, published_category, published_location):
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=published_location,
+        image=_upload(),
+    )
+
+
+def _existing(image_name):
+    return [
+        name for name in thumbnail_names(image_name)
+        if default_storage.exists(name)
+    ]
+
+
+def test_thumbnails_are_created_by_job(photo_post):
+    image_name = photo_post.image.name
+    assert not _existing(image_name)
+    assert run_pending_jobs() == [True]
+    assert len(_existing(image_name)) == 4
+    for variant, size in (("card", 640), ("detail", 1280)):
+        for image_format in ("jpeg", "webp"):
+            name = thumbnail_name(image_name, variant, image_format)
+            with default_storage.open(name) as thumbnail:
+                assert max(Image.open(thumbnail).size) == size
+    photo_post.refresh_from_db()
+    assert photo_post.thumbnails == {"card": 640, "detail": 1280}
+
+
+def test_thumbnail_names_keep_extension():
+    assert thumbnail_name("a/photo.png", "card", "jpeg") != thumbnail_name(
+        "a/photo.jpg", "card", "jpeg"
+    )
+
+
+def test_srcset_uses_real_widths(
+        mixer, client, user, published_category
+):
+    post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=None,
+        image=_upload(size=(500, 300)),
+    )
+    run_pending_jobs()
+    post.refresh_from_db()
+    assert post.thumbnails == {"card": 500, "detail": 500}
+    content = client.get(f"/posts/{post.id}/").content.decode()
+    assert " 500w" in content
+    assert " 1280w" not in content
+
+
+def test_templates_serve_thumbnails(client, photo_post):
+    run_pending_jobs()
+    image_name = photo_post.image.name
+    webp_url = default_storage.url(
+        thumbnail_name(image_name, "detail", "webp")
+    )
+    pages = (("/", "card"), (f"/posts/{photo_post.id}/", "detail"))
+    for url, variant in pages:
+        src = default_storage.url(thumbnail_name(image_name, variant, "jpeg"))
+        content = client.get(url).content.decode()
+        assert f'src="{src}"' in content
+        assert f"{webp_url} 1280w" in content
+        assert f'src="{photo_post.image.url}"' not in content
+
+
+def test_rendering_never_generates_thumbnails(client, photo_post):
+    image_name = photo_post.image.name
+    with patch("blog.thumbnails.generate_thumbnails") as generate:
+        content = client.get(f"/posts/{photo_post.id}/").content.decode()
+    generate.assert_not_called()
+    assert not _existing(image_name)
+    assert f'src="{photo_post.image.url}"' in content
+
+
+def test_command_queues_missing_thumbnails(photo_post):
+    run_pending_jobs()
+    Post.objects.update(thumbnails={})
+    call_command("generate_thumbnails", stdout=StringIO())
+    assert run_pending_jobs() == [True]
+    assert Post.objects.get(pk=photo_post.pk).thumbnails["card"] == 640
+
+
+def test_stale_thumbnails_are_removed(photo_post):
+    run_pending_jobs()
+    old_name = photo_post.image.name
+    photo_post.image = _upload("other.png", (800, 600))
+    photo_post.save()
+    assert not _existing(old_name)
+    run_pending_jobs()
+    new_name = photo_post.image.name
+    assert len(_existing(new_name)) == 4
+    photo_post.delete()
+    assert not _existing(new_name)
+
+
+def test_broken_image_falls_back_to_original(
+        mixer, client, user, published_category
+):
+    post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        image=SimpleUploadedFile("broken.png", b"not an image"),
+    )
+    run_pending_jobs()
+    assert not _existing(post.image.name)
+    assert Post.objects.get(pk=post.pk).thumbnails is None
+    with patch("blog.thumbnails.generate_thumbnails") as generate:
+        for _ in range(2):
+            content = client.get(f"/posts/{post.id}/").content.decode()
+            assert f'src="{post.image.url}"' in content
+    generate.assert_not_called()
+
+
+def test_fixture_loads_keep_thumbnails(photo_post, tmp_path):
+    run_pending_jobs()
+    image_name = photo_post.image.name
+    fixture = tmp_path / "posts.json"
+    call_command("dumpdata", "blog.post", output=str(fixture))
+    call_command("loaddata", str(fixture), verbosity=0)
+    assert len(_existing(image_name)) == 4
+    assert Post.objects.get(pk=photo_post.pk).thumbnails["card"] == 640
+    assert run_pending_jobs() == []
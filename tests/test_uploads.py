@@ -0,0 +1,97 @@
+from http import HTTPStatus
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.test import RequestFactory
+from django.utils import timezone
+from PIL import Image
+
+from blog.models import Post
+from core.uploads import OversizedUpload
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _png(size):
+    buffer = BytesIO()
+    Image.new("RGB", size, "navy").save(buffer, format="PNG")
+    return SimpleUploadedFile("photo.png", buffer.getvalue(), "image/png")
+
+
+def _create(client, category, image):
+    return client.post(
+        "/posts/create/",
+        {
+            "title": "Фото",
+            "text": "Текст",
+            "pub_date": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "category": category.id,
+            "image": image,
+        },
+    )
+
+
+def test_oversized_image_stops_writing_to_disk(settings, monkeypatch):
+    settings.UPLOAD_MAX_FILE_SIZE = 100 * 1024
+    written = []
+    receive = TemporaryFileUploadHandler.receive_data_chunk
+
+    def record(handler, raw_data, start):
+        written.append(len(raw_data))
+        return receive(handler, raw_data, start)
+
+    monkeypatch.setattr(
+        TemporaryFileUploadHandler, "receive_data_chunk", record
+    )
+    request = RequestFactory().post(
+        "/",
+        {
+            "image": SimpleUploadedFile("photo.png", b"x" * 300 * 1024),
+            "title": "Фото",
+        },
+    )
+    uploaded = request.FILES["image"]
+    assert isinstance(uploaded, OversizedUpload)
+    assert uploaded.size == 300 * 1024
+    assert sum(written) <= settings.UPLOAD_MAX_FILE_SIZE
+    assert request.POST["title"] == "Фото"
+
+
+def test_other_uploads_are_not_truncated(settings):
+    settings.UPLOAD_MAX_FILE_SIZE = 10
+    request = RequestFactory().post(
+        "/", {"file": SimpleUploadedFile("data.bin", b"x" * 30)}
+    )
+    uploaded = request.FILES["file"]
+    assert uploaded.size == 30
+    assert uploaded.read() == b"x" * 30
+    uploaded.close()
+
+
+def test_oversized_upload_is_rejected(
+        settings, user_client, published_category
+):
+    image = _png((200, 200))
+    settings.UPLOAD_MAX_FILE_SIZE = image.size - 1
+    response = _create(user_client, published_category, image)
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["form"].has_error("image", "file_too_large")
+    assert not Post.objects.exists()
+
+
+def test_image_with_too_many_pixels_is_rejected(
+        settings, user_client, published_category
+):
+    settings.POSTS_IMAGE_MAX_PIXELS = 100 * 100
+    response = _create(user_client, published_category, _png((101, 100)))
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["form"].has_error("image", "too_many_pixels")
+    assert not Post.objects.exists()
+
+
+def test_image_within_limits_is_saved(user_client, published_category):
+    response = _create(user_client, published_category, _png((100, 100)))
+    assert response.status_code == HTTPStatus.FOUND
+    assert Post.objects.get().image.width == 100